@@ -0,0 +1,284 @@
+""" End-to-end export benchmark.  Runs default.export_set_data() outside
+Kodi against the stand-in xbmc modules in stubs/ and a synthetic library,
+exporting into a temporary MSIF.
+
+For each case it reports sets/s, filesystem calls, set.nfo bytes written
+and peak Python memory.  Results go to results/latest.json, which is not
+committed; keep a named copy of a version's results to compare against:
+
+    python benchmarks/bench_export.py --sizes 1000,10000 --kinds ascii,cjk
+    python benchmarks/bench_export.py --compare benchmarks/results/1.0.2-616c4cf.json
+"""
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+ADDON_DIR = BENCH_DIR.parent / 'script.export_set'
+RESULTS_DIR = BENCH_DIR / 'results'
+sys.path[:0] = [str(BENCH_DIR / 'stubs'), str(ADDON_DIR), str(BENCH_DIR)]
+
+import xbmc  # noqa: E402  pylint: disable=wrong-import-position
+import xbmcaddon  # noqa: E402  pylint: disable=wrong-import-position
+import xbmcgui  # noqa: E402  pylint: disable=wrong-import-position
+import xbmcvfs  # noqa: E402  pylint: disable=wrong-import-position
+from library import TITLE_KINDS, make_library  # noqa: E402  pylint: disable=wrong-import-position
+from lib.msif import MsifIndex  # noqa: E402  pylint: disable=wrong-import-position
+from lib.vfs import VfsMsifIndex  # noqa: E402  pylint: disable=wrong-import-position
+
+NETWORK_URL = 'smb://bench/sets/'
+TARGETS = ('folders', 'zip', 'tar', 'xml')  # export_target setting values
+# audited filesystem events counted as calls; stat is not audited and is counted by wrapping os.stat
+_FS_EVENTS = frozenset({'open', 'os.mkdir', 'os.scandir', 'os.listdir', 'os.rename', 'os.remove', 'os.rmdir'})
+
+
+class FsCounter:
+    """Counts filesystem calls while active"""
+
+    def __init__(self):
+        self.active = False
+        self.counts: dict[str, int] = {}
+        sys.addaudithook(self._audit)
+
+    def _audit(self, event: str, _args):
+        if self.active and event in _FS_EVENTS:
+            self.counts[event] = self.counts.get(event, 0) + 1
+
+    @contextmanager
+    def counting(self):
+        """Count calls made inside the block"""
+        self.counts = {}
+        os_stat = os.stat
+
+        def counted_stat(*args, **kwargs):
+            if self.active:
+                self.counts['os.stat'] = self.counts.get('os.stat', 0) + 1
+            return os_stat(*args, **kwargs)
+
+        os.stat = counted_stat
+        self.active = True
+        try:
+            yield self.counts
+        finally:
+            self.active = False
+            os.stat = os_stat
+
+
+@contextmanager
+def counting_writes():
+    """Total bytes written by the MSIF index write_nfo and create_nfo methods inside the block"""
+    written = {'bytes': 0, 'files': 0}
+    originals = {(cls, method): getattr(cls, method) for cls in (MsifIndex, VfsMsifIndex)
+                 for method in ('write_nfo', 'create_nfo')}
+    depth = threading.local()  # VfsMsifIndex.create_nfo writes through write_nfo
+
+    def wrap(method):
+        def counted(index, name, data):
+            depth.value = getattr(depth, 'value', 0) + 1
+            try:
+                result = method(index, name, data)
+            finally:
+                depth.value -= 1
+            if result is not False and not depth.value:
+                written['bytes'] += len(data)
+                written['files'] += 1
+            return result
+        return counted
+
+    for (cls, name), method in originals.items():
+        setattr(cls, name, wrap(method))
+    try:
+        yield written
+    finally:
+        for (cls, name), method in originals.items():
+            setattr(cls, name, method)
+
+
+def addon_version() -> str:
+    return ET.parse(ADDON_DIR / 'addon.xml').getroot().get('version', 'unknown')
+
+
+def source_commit() -> str:
+    """Short hash of the checked out commit, with -dirty if the addon has local changes"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ADDON_DIR, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--', '.'], cwd=ADDON_DIR, capture_output=True,
+                               text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+    return f'{commit}-dirty' if dirty else commit
+
+
+def run_export(workdir: Path, overwrite: bool, network: bool, fs_counter: FsCounter, trace: bool,
+               processes: int = 1) -> dict:
+    """One export_set_data() run against the library already loaded in the xbmc stub
+
+    Returns:
+        dict: seconds, fs calls, bytes and files written, peak memory if traced
+    """
+    msif = workdir / 'msif'
+    xbmcgui.ANSWERS['yesno'] = overwrite
+    xbmc.LOG.clear()
+    xbmc.RPC_CALLS.clear()
+    xbmcvfs.unmount_all()
+    if network:
+        xbmcvfs.mount(NETWORK_URL, msif)
+        msif.mkdir(exist_ok=True)
+    sys.modules.pop('default', None)
+    if trace:
+        tracemalloc.start()
+    with fs_counter.counting() as fs_calls, counting_writes() as written:
+        started = time.perf_counter()
+        default = importlib.import_module('default')  # reads the MSIF setting at import
+        default.export_set_data(sif=default.MSIF, processes=processes)
+        seconds = time.perf_counter() - started
+    archives = [path for path in msif.glob('movie_sets.*') if path.is_file()]
+    if archives:  # a consolidated export target writes one file instead
+        written = {'bytes': archives[0].stat().st_size, 'files': 1}
+    result = {'seconds': round(seconds, 4), 'fs_calls': sum(fs_calls.values()),
+              'fs_calls_by_kind': dict(sorted(fs_calls.items())), 'bytes_written': written['bytes'],
+              'files_written': written['files'], 'rpc_calls': len(xbmc.RPC_CALLS), 'log_lines': len(xbmc.LOG)}
+    if trace:
+        result['peak_memory'] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    errors = [message for level, message in xbmc.LOG if level >= xbmc.LOGERROR]
+    if errors:
+        raise RuntimeError(f'export failed: {errors[0]}')
+    return result
+
+
+def run_case(size: int, kind: str, plot_length: int, network: bool, memory: bool, fs_counter: FsCounter,
+             extras: bool = False, pipelined: bool = False, processes: int = 1, target: str = 'folders') -> dict:
+    """Fresh export into an empty MSIF, then a second run with overwrite,
+    which finds every set.nfo up to date
+
+    Returns:
+        dict: results of both runs
+    """
+    library = make_library(size, kind, plot_length)
+    case = {'sets': size, 'titles': kind, 'plot_length': plot_length, 'network': network, 'extras': extras,
+            'pipeline': pipelined, 'processes': processes, 'target': target}
+    settings = {f'nfo_{field}': True for field in ('originaltitle', 'art', 'movies')} if extras else {}
+    settings.update(pipeline=pipelined, export_target=TARGETS.index(target))
+    with tempfile.TemporaryDirectory(prefix='export_set_bench_') as tmp:
+        workdir = Path(tmp)
+        msif_setting = NETWORK_URL if network else str(workdir / 'msif')
+        for run in ('export', 'rerun'):
+            xbmc.reset(library, {'videolibrary.moviesetsfolder': msif_setting})
+            xbmcaddon.reset(str(workdir / 'profile'), **settings)
+            result = run_export(workdir, overwrite=run == 'rerun', network=network,
+                                fs_counter=fs_counter, trace=False, processes=processes)
+            result['sets_per_second'] = round(size / result['seconds'], 1) if result['seconds'] else 0.0
+            case[run] = result
+        if memory:  # traced separately, tracemalloc slows the run down
+            for leftover in (workdir / 'msif', workdir / 'profile'):
+                _remove_tree(leftover)
+            xbmc.reset(library, {'videolibrary.moviesetsfolder': msif_setting})
+            xbmcaddon.reset(str(workdir / 'profile'), **settings)
+            case['export']['peak_memory'] = run_export(workdir, overwrite=False, network=network,
+                                                       fs_counter=fs_counter, trace=True,
+                                                       processes=processes)['peak_memory']
+    xbmcvfs.unmount_all()
+    return case
+
+
+def _remove_tree(path: Path):
+    if not path.exists():
+        return
+    for child in sorted(path.rglob('*'), key=lambda p: len(p.parts), reverse=True):
+        if child.is_dir():
+            child.rmdir()
+        else:
+            child.unlink()
+    path.rmdir()
+
+
+def case_name(case: dict) -> str:
+    name = f"{case['sets']}-{case['titles']}-plot{case['plot_length']}"
+    if case.get('extras'):
+        name += '-extras'
+    if case.get('pipeline'):
+        name += '-pipeline'
+    if case.get('target', 'folders') != 'folders':
+        name += f"-{case['target']}"
+    if case.get('processes', 1) > 1:
+        name += f"-{case['processes']}proc"
+    if case.get('rpc_latency_ms'):
+        name += f"-rpc{case['rpc_latency_ms']:g}ms"
+    return name + '-network' if case['network'] else name
+
+
+def print_case(name: str, case: dict, baseline: dict = None):
+    for run in ('export', 'rerun'):
+        result = case[run]
+        line = (f"{name:32} {run:6} {result['sets_per_second']:>10.1f} sets/s {result['fs_calls']:>8} fs calls "
+                f"{result['bytes_written']:>12} bytes")
+        if 'peak_memory' in result:
+            line += f" {result['peak_memory'] / 2**20:8.1f} MiB peak"
+        if baseline and name in baseline and baseline[name][run]['sets_per_second']:
+            ratio = result['sets_per_second'] / baseline[name][run]['sets_per_second']
+            line += f'  x{ratio:.2f} vs baseline'
+        print(line, flush=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='1000,10000', help='comma separated set counts, e.g. 1000,10000,100000')
+    parser.add_argument('--kinds', default=','.join(TITLE_KINDS), help=f'title kinds from {TITLE_KINDS}')
+    parser.add_argument('--plot-length', type=int, default=300, help='approximate plot length, e.g. 5000 for long plots')
+    parser.add_argument('--network', action='store_true', help='export to an smb:// MSIF through the VFS stand-in')
+    parser.add_argument('--extras', action='store_true', help='write original titles, art and member movies')
+    parser.add_argument('--pipeline', action='store_true', help='export with the pipelined export setting on')
+    parser.add_argument('--target', choices=TARGETS, default='folders', help='export target setting')
+    parser.add_argument('--processes', type=int, default=1, help='render processes')
+    parser.add_argument('--rpc-latency', type=float, default=0.0, help='milliseconds added to each JSON-RPC round trip')
+    parser.add_argument('--no-memory', action='store_true', help='skip the traced peak memory run')
+    parser.add_argument('--compare', type=Path, help='results file to compare sets/s against')
+    parser.add_argument('--output', type=Path, help='results file. Defaults to results/latest.json')
+    parser.add_argument('--no-save', action='store_true', help='do not write a results file')
+    args = parser.parse_args(argv)
+
+    baseline = json.loads(args.compare.read_text(encoding='utf-8'))['cases'] if args.compare else None
+    fs_counter = FsCounter()
+    xbmc.RPC_LATENCY[0] = args.rpc_latency / 1000
+    cases = {}
+    for size in (int(size) for size in args.sizes.split(',')):
+        for kind in args.kinds.split(','):
+            case = run_case(size, kind, args.plot_length, args.network, not args.no_memory, fs_counter, args.extras,
+                            args.pipeline, args.processes, args.target)
+            if args.rpc_latency:
+                case['rpc_latency_ms'] = args.rpc_latency
+            name = case_name(case)
+            cases[name] = case
+            print_case(name, case, baseline)
+
+    if not args.no_save:
+        version, commit = addon_version(), source_commit()
+        output = args.output or RESULTS_DIR / 'latest.json'
+        output.parent.mkdir(parents=True, exist_ok=True)
+        stored = json.loads(output.read_text(encoding='utf-8')) if output.exists() else {'cases': {}}
+        if stored.get('commit') != commit:  # only merge cases measured on the same code
+            stored = {'cases': {}}
+        stored.update({'version': version, 'commit': commit, 'python': platform.python_version(),
+                       'platform': platform.platform(), 'date': datetime.now(timezone.utc).isoformat(timespec='seconds')})
+        stored['cases'].update(cases)
+        output.write_text(json.dumps(stored, indent=2, sort_keys=True) + '\n', encoding='utf-8')
+        print(f'results saved to {output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+""" Synthetic Kodi movie set libraries for the export benchmarks.  Libraries
+are generated from a fixed seed so runs are comparable.
+"""
+
+import random
+
+TITLE_KINDS = ('ascii', 'cjk', 'emoji')
+
+_WORDS = ('Star', 'Wars', 'Collection', 'Alien', 'Matrix', 'Harry', 'Potter', 'Lord', 'Rings', 'Bond',
+          'Mission', 'Impossible', 'Toy', 'Story', 'Fast', 'Furious', 'Jurassic', 'Park', 'Rocky', 'Die', 'Hard')
+# characters the sanitizer has to replace on at least one platform
+_AWKWARD = (':', '?', '/', '*', '"', '<', '>', '|', '\\', '.', ' ')
+_EMOJI = ('\U0001F3AC', '\U0001F47D', '\U0001F680', '\U0001F9DB', '\U0001F409', '❤️', '\U0001F1EF\U0001F1F5')
+
+
+def _cjk(rnd: random.Random, length: int) -> str:
+    return ''.join(chr(rnd.randint(0x4E00, 0x9FA5)) for _ in range(length))
+
+
+def make_title(rnd: random.Random, kind: str, number: int) -> str:
+    """One set title.  About one title in five contains characters that need sanitizing.
+
+    Args:
+        rnd (random.Random): generator
+        kind (str): one of TITLE_KINDS
+        number (int): set number, keeps titles unique
+
+    Returns:
+        str: the title
+    """
+    words = ' '.join(rnd.choice(_WORDS) for _ in range(rnd.randint(1, 4)))
+    if kind == 'cjk':
+        words = f'{_cjk(rnd, rnd.randint(2, 12))} {words}'
+    elif kind == 'emoji':
+        words = f'{rnd.choice(_EMOJI)} {words} {rnd.choice(_EMOJI)}'
+    if rnd.random() < 0.2:
+        words += rnd.choice(_AWKWARD) + rnd.choice(_WORDS)
+    return f'{words} Collection {number}'
+
+
+def make_plot(rnd: random.Random, kind: str, length: int) -> str:
+    """A plot of about length characters, with some XML special characters
+
+    Args:
+        rnd (random.Random): generator
+        kind (str): one of TITLE_KINDS
+        length (int): approximate plot length
+
+    Returns:
+        str: the plot
+    """
+    parts = []
+    size = 0
+    while size < length:
+        part = ' '.join(rnd.choice(_WORDS) for _ in range(8))
+        if kind == 'cjk':
+            part += _cjk(rnd, 6)
+        elif kind == 'emoji':
+            part += rnd.choice(_EMOJI)
+        if rnd.random() < 0.1:
+            part += ' & <friends>'
+        parts.append(part)
+        size += len(part) + 2
+    return '. '.join(parts)
+
+
+def make_art(rnd: random.Random) -> dict:
+    """Set art as Kodi returns it, image:// wrapped urls"""
+    def image(kind: str) -> str:
+        return f'image://https%3a%2f%2fimage.tmdb.org%2ft%2fp%2foriginal%2f{kind}{rnd.getrandbits(48):x}.jpg/'
+    return {kind: image(kind) for kind in ('poster', 'fanart') if rnd.random() < 0.9}
+
+
+def make_movies(rnd: random.Random, kind: str, first_movieid: int) -> list:
+    """Member movies with the properties GetMovieSetDetails can return"""
+    movies = []
+    for movieid in range(first_movieid, first_movieid + rnd.randint(1, 6)):
+        title = make_title(rnd, kind, movieid).replace('Collection', 'Part')
+        movies.append({'movieid': movieid, 'label': title, 'title': title, 'year': rnd.randint(1950, 2025),
+                       'uniqueid': {'tmdb': str(rnd.randint(1, 999999)), 'imdb': f'tt{rnd.randint(1, 9999999):07d}'}})
+    return movies
+
+
+def make_library(size: int, kind: str = 'ascii', plot_length: int = 300, seed: int = 1) -> list:
+    """Movie sets as returned by VideoLibrary.GetMovieSets with the title and plot properties
+
+    Args:
+        size (int): number of sets
+        kind (str, optional): one of TITLE_KINDS. Defaults to 'ascii'.
+        plot_length (int, optional): approximate plot length. Defaults to 300.
+        seed (int, optional): random seed. Defaults to 1.
+
+    Returns:
+        list[dict]: the sets, with originaltitle, art and member movies
+    """
+    if kind not in TITLE_KINDS:
+        raise ValueError(f'unknown title kind {kind}, expected one of {TITLE_KINDS}')
+    rnd = random.Random(f'{seed}-{kind}-{size}-{plot_length}')
+    extras_rnd = random.Random(f'{seed}-{kind}-{size}-extras')  # keeps titles and plots independent of the extras
+    library = []
+    movieid = 1
+    for setid in range(1, size + 1):
+        title = make_title(rnd, kind, setid)
+        movies = make_movies(extras_rnd, kind, movieid)
+        movieid += len(movies)
+        library.append({'setid': setid, 'label': title, 'title': title, 'originaltitle': title,
+                        'plot': make_plot(rnd, kind, plot_length), 'art': make_art(extras_rnd), 'movies': movies})
+    return library
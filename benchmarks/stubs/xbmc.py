@@ -0,0 +1,91 @@
+""" Stand-in for Kodi's xbmc module.  JSON-RPC requests are answered from
+an in-memory library; log lines are kept in LOG instead of printed.
+"""
+
+import json
+import time
+
+LOGDEBUG = 0
+LOGINFO = 1
+LOGWARNING = 2
+LOGERROR = 3
+LOGFATAL = 4
+LOGNONE = 7
+
+LOG: list = []  # (level, message)
+SETTINGS: dict = {}  # Kodi (not addon) settings for Settings.GetSettingValue
+LIBRARY: list = []  # movie sets, dicts as returned by VideoLibrary.GetMovieSets
+RPC_CALLS: list = []  # method of every request, batch members included
+RPC_LATENCY = [0.0]  # seconds each executeJSONRPC round trip takes, as over a busy Kodi
+
+
+def log(msg: str, level: int = LOGDEBUG):
+    LOG.append((level, msg))
+
+
+def reset(library: list, settings: dict):
+    """Serve a new library and Kodi settings, and forget logs and calls"""
+    LIBRARY[:] = library
+    SETTINGS.clear()
+    SETTINGS.update(settings)
+    LOG.clear()
+    RPC_CALLS.clear()
+
+
+def _error(request: dict, code: int, message: str) -> dict:
+    return {'id': request.get('id'), 'jsonrpc': '2.0', 'error': {'code': code, 'message': message}}
+
+
+_index: dict = {}
+
+
+def _by_setid() -> dict:
+    """setid -> [set], rebuilt when the library changes"""
+    if _index.get('library') is not LIBRARY or _index.get('size') != len(LIBRARY):
+        _index.update(library=LIBRARY, size=len(LIBRARY),
+                      sets={movie_set['setid']: [movie_set] for movie_set in LIBRARY})
+    return _index['sets']
+
+
+def _movie_sets(params: dict) -> dict:
+    limits = params.get('limits', {})
+    start = limits.get('start', 0)
+    end = limits.get('end', -1)
+    end = len(LIBRARY) if end < 0 else min(end, len(LIBRARY))
+    properties = ['setid', 'label'] + list(params.get('properties', []))
+    sets = [{key: movie_set[key] for key in properties if key in movie_set} for movie_set in LIBRARY[start:end]]
+    return {'limits': {'start': start, 'end': end, 'total': len(LIBRARY)}, 'sets': sets}
+
+
+def _answer(request: dict) -> dict:
+    RPC_CALLS.append(request.get('method'))
+    method = request.get('method')
+    params = request.get('params', {})
+    if method == 'Settings.GetSettingValue':
+        if params.get('setting') not in SETTINGS:
+            return _error(request, -32602, 'Invalid params.')
+        result = {'value': SETTINGS[params['setting']]}
+    elif method == 'VideoLibrary.GetMovieSets':
+        result = _movie_sets(params)
+    elif method == 'VideoLibrary.GetMovieSetDetails':
+        found = [movie_set for movie_set in _by_setid().get(params.get('setid'), ())]
+        if not found:
+            return _error(request, -32602, 'Invalid params.')
+        properties = ['setid', 'label'] + list(params.get('properties', []))
+        result = {'setdetails': {key: found[0][key] for key in properties if key in found[0]}}
+        if 'movies' in params:
+            properties = ['movieid', 'label'] + list(params['movies'].get('properties', []))
+            result['setdetails']['movies'] = [{key: movie[key] for key in properties if key in movie}
+                                              for movie in found[0].get('movies', [])]
+    else:
+        return _error(request, -32601, 'Method not found.')
+    return {'id': request.get('id'), 'jsonrpc': '2.0', 'result': result}
+
+
+def executeJSONRPC(jsonrpccommand: str) -> str:  # pylint: disable=invalid-name
+    if RPC_LATENCY[0]:
+        time.sleep(RPC_LATENCY[0])
+    request = json.loads(jsonrpccommand)
+    if isinstance(request, list):
+        return json.dumps([_answer(member) for member in request])
+    return json.dumps(_answer(request))
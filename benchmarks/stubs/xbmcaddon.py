@@ -0,0 +1,65 @@
+""" Stand-in for Kodi's xbmcaddon module.  Settings start from the defaults
+in the addon's resources/settings.xml and can be overridden in SETTINGS.
+"""
+
+import re
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+ADDON_DIR = Path(__file__).resolve().parents[2] / 'script.export_set'
+INFO = {'id': 'script.export_set', 'path': str(ADDON_DIR), 'profile': ''}
+SETTINGS: dict = {}
+
+
+def default_settings() -> dict:
+    """Setting id -> default value from settings.xml"""
+    defaults = {}
+    for setting in ET.parse(ADDON_DIR / 'resources' / 'settings.xml').iter('setting'):
+        value = setting.findtext('default', '')
+        if setting.get('type') == 'boolean':
+            defaults[setting.get('id')] = value == 'true'
+        elif setting.get('type') == 'integer':
+            defaults[setting.get('id')] = int(value)
+        else:
+            defaults[setting.get('id')] = value
+    return defaults
+
+
+def localized_strings() -> dict:
+    """String id -> English text from the addon's strings.po"""
+    po = (ADDON_DIR / 'resources' / 'language' / 'resource.language.en_gb' / 'strings.po').read_text(encoding='utf-8')
+    return {int(string_id): text for string_id, text in re.findall(r'msgctxt "#(\d+)"\nmsgid "(.*)"', po)}
+
+
+STRINGS = localized_strings()
+
+
+def reset(profile: str, **overrides):
+    """Default settings plus overrides, and a new profile folder"""
+    INFO['profile'] = profile
+    SETTINGS.clear()
+    SETTINGS.update(default_settings())
+    SETTINGS.update(overrides)
+
+
+class Addon:
+    def __init__(self, id: str = None):  # pylint: disable=redefined-builtin
+        self.id = id
+
+    def getAddonInfo(self, id: str) -> str:  # pylint: disable=invalid-name,redefined-builtin
+        return INFO.get(id, '')
+
+    def getLocalizedString(self, id: int) -> str:  # pylint: disable=invalid-name,redefined-builtin
+        return STRINGS.get(id, '')
+
+    def getSetting(self, id: str) -> str:  # pylint: disable=invalid-name,redefined-builtin
+        return str(SETTINGS.get(id, ''))
+
+    def getSettingBool(self, id: str) -> bool:  # pylint: disable=invalid-name,redefined-builtin
+        return bool(SETTINGS[id])
+
+    def getSettingInt(self, id: str) -> int:  # pylint: disable=invalid-name,redefined-builtin
+        return int(SETTINGS[id])
+
+    def getSettingString(self, id: str) -> str:  # pylint: disable=invalid-name,redefined-builtin
+        return str(SETTINGS[id])
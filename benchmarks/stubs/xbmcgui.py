@@ -0,0 +1,17 @@
+""" Stand-in for Kodi's xbmcgui module.  Dialogs return preset answers.
+"""
+
+ANSWERS = {'yesno': False}
+NOTIFICATIONS: list = []
+
+
+class Dialog:
+    def ok(self, heading: str, message: str) -> bool:
+        return True
+
+    def yesno(self, heading: str, message: str, *args, **kwargs) -> bool:
+        return ANSWERS['yesno']
+
+    def notification(self, heading: str, message: str, *args, **kwargs):
+        NOTIFICATIONS.append((heading, message))
+
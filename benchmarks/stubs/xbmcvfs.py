@@ -0,0 +1,130 @@
+""" Stand-in for the subset of Kodi's xbmcvfs module used by the addon,
+backed by local folders.  mount() maps a url prefix such as
+'smb://nas/share/' onto a local directory so network MSIF exports can be
+run outside Kodi:
+
+    import xbmcvfs
+    from lib.vfs import VfsMsifIndex
+    xbmcvfs.mount('smb://nas/sets/', '/tmp/sets')
+    index = VfsMsifIndex.scan('smb://nas/sets/', vfs=xbmcvfs)
+"""
+
+import os
+from pathlib import Path
+
+_mounts: dict[str, Path] = {}
+
+
+def mount(url_prefix: str, local_dir) -> None:
+    """Serve urls starting with url_prefix from local_dir"""
+    _mounts[url_prefix.rstrip('/') + '/'] = Path(local_dir)
+
+
+def unmount_all() -> None:
+    """Forget every mount"""
+    _mounts.clear()
+
+
+def _local(url: str) -> Path:
+    for prefix, local_dir in _mounts.items():
+        if url.startswith(prefix) or url.rstrip('/') + '/' == prefix:
+            return local_dir / url[len(prefix):].strip('/')
+    raise OSError(f'no local mount for {url}')
+
+
+def translatePath(path: str) -> str:  # pylint: disable=invalid-name
+    """xbmcvfs.translatePath for mounted urls; other paths are returned unchanged"""
+    try:
+        return str(_local(path))
+    except OSError:
+        return path
+
+
+def exists(path: str) -> bool:
+    try:
+        return _local(path).exists()
+    except OSError:  # like an unreachable share
+        return False
+
+
+def mkdirs(path: str) -> bool:
+    try:
+        _local(path).mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return False
+    return True
+
+
+def listdir(path: str) -> tuple[list[str], list[str]]:
+    dirs, files = [], []
+    try:
+        with os.scandir(_local(path)) as entries:
+            for entry in entries:
+                (dirs if entry.is_dir() else files).append(entry.name)
+    except OSError:
+        pass
+    return dirs, files
+
+
+def delete(path: str) -> bool:
+    try:
+        _local(path).unlink()
+    except OSError:
+        return False
+    return True
+
+
+def rmdir(path: str, force: bool = False) -> bool:  # pylint: disable=unused-argument
+    try:
+        _local(path).rmdir()
+    except OSError:
+        return False
+    return True
+
+
+def rename(file: str, newFile: str) -> bool:  # pylint: disable=invalid-name
+    try:
+        os.replace(_local(file), _local(newFile))
+    except OSError:
+        return False
+    return True
+
+
+class Stat:
+    def __init__(self, path: str):
+        self._stat = _local(path).stat()
+
+    def st_size(self) -> int:
+        return self._stat.st_size
+
+    def st_mtime(self) -> int:
+        return int(self._stat.st_mtime)
+
+
+class File:
+    def __init__(self, path: str, mode: str = ''):
+        self._file = open(_local(path), 'wb' if mode == 'w' else 'rb')  # pylint: disable=consider-using-with
+
+    def __enter__(self) -> 'File':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def readBytes(self, numBytes: int = -1) -> bytearray:  # pylint: disable=invalid-name
+        return bytearray(self._file.read(numBytes if numBytes > 0 else -1))
+
+    def read(self, numBytes: int = -1) -> str:  # pylint: disable=invalid-name
+        return self.readBytes(numBytes).decode('utf-8')
+
+    def write(self, buffer) -> bool:
+        if isinstance(buffer, str):
+            buffer = buffer.encode('utf-8')
+        self._file.write(buffer)
+        return True
+
+    def size(self) -> int:
+        return os.fstat(self._file.fileno()).st_size
+
+    def close(self):
+        self._file.close()
@@ -17,6 +17,7 @@
 #    along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
 #    PathValidate package 3.3.1 Copyright (c) 2016-2025 Tsuyoshi Hombashi
+#    (locally modified fork, see lib/pathvalidate/__version__.py)
 #    The MIT license:
 #
 #    Permission is hereby granted, free of charge, to any person obtaining a copy
@@ -42,107 +43,704 @@ Raises:
     a Kodi LOGERROR and UI ok popup.
 """
 
-import xml.etree.ElementTree as ET
+import sys
+import time
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from itertools import islice
 from pathlib import Path
-from urllib.parse import urlencode, urlparse
+from urllib.parse import urlparse
 
-import simplejson
 #import smbclient
 import xbmc
 import xbmcaddon
 import xbmcgui
-from lib.pathvalidate import sanitize_filepath
+import xbmcvfs
+from lib.archive import ARCHIVE_NAMES, TAR, XML, ZIP, open_set_archive
+from lib.importer import read_set_nfo, set_changes
+from lib.jsonrpc import JsonRpcClient, JsonRpcError
+from lib.log import Lazy, Logger
+from lib.manifest import MANIFEST_FILENAME, ExportManifest
+from lib.msif import MsifIndex
+from lib.pathvalidate import SanitizeReport
+from lib.pipeline import Pipeline
+from lib.reconcile import archive_orphans, find_orphans, remove_orphans
+from lib.render import RenderConfig, prepare_chunks, render_chunk, sanitize_chunk, sanitize_titles
+from lib.stats import REPORT_FILENAME, RENDER, RETRIEVE, SANITIZE, SETTINGS, WRITE, ExportStats
+from lib.vfs import NETWORK_SCHEMES, VfsMsifIndex, redact_url
+from lib.writer import CREATED, KEPT, ParallelWriter, format_counts, write_set_nfo
 
 MSIF = None
+MSIF_URL = None  # smb:// or nfs:// MSIF, written through xbmcvfs
 ADDON = xbmcaddon.Addon()
 ADDON_ID = ADDON.getAddonInfo('id')
+RPC = JsonRpcClient()
+LOG = Logger(ADDON_ID, log=xbmc.log)
+STATS = ExportStats()
+RUNNING_PROPERTY = f'{ADDON_ID}.running'  # home window property set while an export runs
 network = False
 
+# RunScript(script.export_set,silent,setids=1;2) from the service: no dialogs, only the listed sets
+SILENT = 'silent' in sys.argv[1:]
+# RunScript(script.export_set,reconcile) from the settings: remove orphaned set folders
+RECONCILE = 'reconcile' in sys.argv[1:]
+# RunScript(script.export_set,import) from the settings: update the library from the set.nfo files
+IMPORT = 'import' in sys.argv[1:]
+SETIDS = [int(setid) for arg in sys.argv[1:] if arg.startswith('setids=')
+          for setid in arg[len('setids='):].split(';') if setid.isdigit()]
+
 # get the Kodi user MSIF from Kodi settings.  If successful MSIF is valid Path object.
 # Note:  Path class will return '.' as path if no argument provided in init.
 try:
-    xbmc.log(f'{ADDON_ID} json result {simplejson.loads(xbmc.executeJSONRPC(
-                '{"jsonrpc":"2.0", "method":"Settings.GetSettingValue", "params":{"setting":"videolibrary.moviesetsfolder"}, "id":1}'))['result']['value']}')
-    parsed_url = urlparse(simplejson.loads(xbmc.executeJSONRPC(
-                '{"jsonrpc":"2.0", "method":"Settings.GetSettingValue", "params":{"setting":"videolibrary.moviesetsfolder"}, "id":1}'))['result']['value'])
-    xbmc.log(f'{ADDON_ID} parsed_url {parsed_url}')
-    if parsed_url.scheme == ('smb' or 'nfs'):
+    with STATS.timed(SETTINGS):  # both settings in one round trip
+        msif_result, debug_result = RPC.batch([
+            ('Settings.GetSettingValue', {'setting': 'videolibrary.moviesetsfolder'}),
+            ('Settings.GetSettingValue', {'setting': 'debug.showloginfo'})])
+    LOG.debug_enabled = isinstance(debug_result, dict) and bool(debug_result.get('value'))
+    if isinstance(msif_result, JsonRpcError):
+        raise msif_result
+    msif_setting = msif_result['value']
+    LOG.debug('json result %s', Lazy(redact_url, msif_setting))
+    parsed_url = urlparse(msif_setting)
+    if parsed_url.scheme in NETWORK_SCHEMES:
         network = True
         MSIF = Path(parsed_url.path)
+        MSIF_URL = parsed_url.geturl()
     else:
-        MSIF = Path(simplejson.loads(xbmc.executeJSONRPC(
-                '{"jsonrpc":"2.0", "method":"Settings.GetSettingValue", "params":{"setting":"videolibrary.moviesetsfolder"}, "id":1}'))['result']['value'])
+        MSIF = Path(msif_setting)
     if (MSIF is None) or (MSIF == Path('.')):
-        xbmcgui.Dialog().ok(ADDON_ID, ADDON.getLocalizedString(32001))
+        if not SILENT:
+            xbmcgui.Dialog().ok(ADDON_ID, ADDON.getLocalizedString(32001))
         MSIF = None
-        xbmc.log(f'{ADDON_ID} invalid or no movie set info folder',
-                 xbmc.LOGWARNING)
+        LOG.warning('invalid or no movie set info folder')
         raise ValueError
-except simplejson.JSONDecodeError:
-    xbmcgui.Dialog().ok(ADDON_ID, ADDON.getLocalizedString(32001))
+except (JsonRpcError, KeyError, TypeError) as err:
+    LOG.warning('could not read the movie set info folder setting: %s', err)
+    if not SILENT:
+        xbmcgui.Dialog().ok(ADDON_ID, ADDON.getLocalizedString(32001))
     MSIF = None
-    xbmc.log(f'{ADDON_ID} invalid or no movie set info folder', xbmc.LOGWARNING)
+    LOG.warning('invalid or no movie set info folder')
 except ValueError:
-    xbmc.log(f'{ADDON_ID} unable to export', xbmc.LOGERROR)
+    LOG.error('unable to export')
+
+# optional set.nfo content, each enabled by the nfo_<field> setting
+FIELD_ORIGINALTITLE = 'originaltitle'
+FIELD_ART = 'art'
+FIELD_MOVIES = 'movies'
+MOVIE_PROPERTIES = ['title', 'year', 'uniqueid']  # member movie details written to set.nfo
+SANITIZE_CHUNK = 500  # set titles sanitized per sanitize_filepaths call
+EXPORT_TARGETS = (None, ZIP, TAR, XML)  # export_target setting values, None for set folders
+
+
+def nfo_fields() -> frozenset:
+    """The optional set.nfo fields enabled in the addon settings"""
+    return frozenset(field for field in (FIELD_ORIGINALTITLE, FIELD_ART, FIELD_MOVIES)
+                     if ADDON.getSettingBool(f'nfo_{field}'))
+
 
-ELEMENTS = ['title', 'overview', 'originaltitle'] #set/collection info to add to set.nfo
+def set_properties(fields: frozenset) -> list[str]:
+    """Video.Fields.MovieSet properties to request for fields"""
+    return ['title', 'plot'] + [field for field in (FIELD_ORIGINALTITLE, FIELD_ART) if field in fields]
 
 
-def get_ET_trees(source: list[list], overwrite=False):
-    """Generate and save to MSIF set.nfo files for each row in source
+def set_row(details: dict, fields: frozenset, movies: list = None) -> list:
+    """Movie set info row [setid, title, plot, originaltitle, extras] from
+    GetMovieSets or GetMovieSetDetails set details
 
     Args:
-        source (list[list]): A list of movie set info.  Each row is a list of set ELEMENTS
+        details (dict): the set details
+        fields (frozenset): enabled optional fields
+        movies (list, optional): member movie details. Defaults to None.
+    """
+    extras = {}
+    if FIELD_ART in fields:
+        extras['art'] = details.get('art') or {}
+    if FIELD_MOVIES in fields:
+        extras['movies'] = movies if movies is not None else details.get('movies', [])
+    return [details.get('setid', 0), details.get('label', ''), details.get('plot', ''),
+            details.get('originaltitle', ''), extras]
+
+
+def render_config() -> RenderConfig:
+    """Sanitize settings for the MSIF.  Network shares are named for the
+    most restrictive (Windows) rules.
+    """
+    return RenderConfig(platform="universal" if network else "auto")
+
+
+def sanitize_set_titles(titles: list[str]) -> SanitizeReport:
+    """Sanitize set titles into MSIF folder names
+
+    Args:
+        titles (list[str]): set titles
+
+    Returns:
+        SanitizeReport: folder name Path for each title, None where it failed
+    """
+    return sanitize_titles(titles, render_config())
+
+
+def msif_location(sif) -> str:
+    """The MSIF for logs, the report and the manifest.  A network MSIF url
+    is given without the user:password@ it may hold.
+
+    Args:
+        sif (Path): the MSIF path
+    """
+    return redact_url(MSIF_URL) if network else str(sif)
+
+
+def scan_msif():
+    """Index the MSIF with one listing
+
+    Returns:
+        MsifIndex or VfsMsifIndex: the index, None if the MSIF could not be read
+    """
+    try:
+        msif_index = VfsMsifIndex.scan(MSIF_URL) if network else MsifIndex.scan(MSIF)
+    except OSError as err:
+        LOG.error('Could not read the MSIF %s due to %s', msif_location(MSIF), err)
+        return None
+    LOG.info('found %d set folders in the MSIF', len(msif_index))
+    return msif_index
+
+
+class SetCollator:
+    """Turns prepared chunks into the sets to export, in row order.  Sets
+    whose title failed to sanitize, or whose folder an earlier set already
+    took, are skipped and logged.  On a file system that ignores case,
+    folders differing only in case are the same folder.
+
+    Args:
+        stats (ExportStats): records sanitize and render times
+        case_sensitive (bool, optional): the MSIF tells names apart by case. Defaults to True.
+    """
+
+    def __init__(self, stats: ExportStats, case_sensitive: bool = True):
+        self.stats = stats
+        self.case_sensitive = case_sensitive
+        self.folders: set[str] = set()  # taken folders, case-folded unless case_sensitive
+        self.sanitized = 0
+        self.changed = 0
+        self.errors = Counter()
+
+    def collate(self, item: tuple) -> Iterator[tuple]:
+        """The sets of a prepared chunk
+
+        Args:
+            item (tuple): (rows, PreparedChunk) from prepare_chunks
+
+        Yields:
+            tuple: (row, folder, nfo_data, digest)
+        """
+        chunk, prepared = item
+        report = prepared.report
+        self.stats.add(SANITIZE, prepared.sanitize_seconds, len(chunk))
+        self.stats.add(RENDER, prepared.render_seconds, len(chunk) - len(report.failed))
+        self.sanitized += len(chunk)
+        self.changed += len(report.changed)
+        self.errors.update(report.error_counts)
+        for row, sani_title, document in zip(chunk, report.results, prepared.documents):
+            if sani_title is None:
+                LOG.repeated('sanitize failure', 'could not sanitize set title %s', row[1])
+                continue
+            folder = str(sani_title)
+            taken = folder if self.case_sensitive else folder.casefold()
+            if taken in self.folders:  # another set sanitized to the same folder
+                LOG.repeated('folder collision', 'set %s shares folder %s with another set, skipped',
+                             row[1], folder)
+                continue
+            self.folders.add(taken)
+            yield (row, folder, *document)
+
+    def fallback(self, err: Exception):
+        """prepare_chunks gave up on render processes"""
+        LOG.warning('render processes unavailable, rendering in this process: %s', err)
+        self.stats.count('render fallback')
+
+    def log_summary(self):
+        LOG.info('sanitized %d set titles, %d changed, %d failed %s',
+                 self.sanitized, self.changed, sum(self.errors.values()), dict(self.errors))
+
+
+def get_ET_trees(source: Iterable[list], overwrite=False, manifest: ExportManifest = None, workers: int = 1,
+                 stats: ExportStats = None, pipelined: bool = False, processes: int = 1,
+                 overwrite_own: bool = False):
+    """Generate and save to MSIF set.nfo files for each row in source.  Rows
+    are consumed in chunks as they arrive, so source can be a generator.
+    If pipelined, retrieval, sanitize/render and writes run concurrently as the
+    stages of a Pipeline.  With processes > 1 chunks are sanitized and rendered
+    in worker processes and written here.  The set.nfo files written are the
+    same either way.
+
+    Args:
+        source (Iterable[list]): Movie set info.  Each row is the setid followed by set ELEMENTS
+            and optionally an extras dict, see render_set_nfo
         overwrite (bool, optional): Should existing set.nfo files be updated. Defaults to False.
+        manifest (ExportManifest, optional): Sets recorded as exported with the same folder and
+            content are skipped; written sets are recorded.  Defaults to None (export all).
+        workers (int, optional): Number of writer threads. Defaults to 1 (write inline).
+        stats (ExportStats, optional): Collects phase times and write outcomes. Defaults to None.
+        pipelined (bool, optional): Run as a Pipeline. Defaults to False.
+        processes (int, optional): Render processes. Defaults to 1 (render in this process).
+        overwrite_own (bool, optional): Without overwrite, still update the set.nfo files the
+            manifest records this addon writing to the same folder. Defaults to False.
     """
-    for row in source:
-        root = ET.Element("set")
-        for index, element in enumerate(ELEMENTS):
-            child = ET.SubElement(root, element)
+    stats = stats if stats is not None else ExportStats()
+    msif_index = scan_msif()
+    if msif_index is None:
+        return
+    outcomes = Counter()
+    config = render_config()
+
+    def written(key, outcome):
+        setid, folder, digest = key
+        outcomes[outcome] += 1
+        stats.count(outcome)
+        if outcome != KEPT:
+            if manifest is not None:
+                manifest.update(setid, folder, digest)
+            LOG.debug('%s file %s', outcome, Lazy(msif_index.nfo_location, folder))
+
+    def failed(key, err):
+        stats.count('failed')
+        LOG.repeated('write failure', 'Could not write set.nfo file for %s due to %s', key[1], err)
+
+    collator = SetCollator(stats, msif_index.case_sensitive())
+
+    def jobs(item: tuple):
+        """Write jobs of a prepared chunk"""
+        for row, folder, nfo_data, digest in collator.collate(item):
+            recorded = manifest is not None and manifest.is_current(row[0], folder, digest)
+            replace = overwrite or (overwrite_own and manifest is not None and manifest.wrote(row[0], folder))
+            yield (row[0], folder, digest), write_set_nfo, (msif_index, folder, nfo_data, replace, recorded, stats)
+
+    rows = iter(source)
+    chunks = iter(lambda: list(islice(rows, SANITIZE_CHUNK)), [])
+    if pipelined:
+        if processes > 1:
+            stages = [('collate', jobs)]
+            chunks = prepare_chunks(chunks, config, processes, collator.fallback)
+        else:
+            stages = [('sanitize', lambda chunk: [(chunk, sanitize_chunk(config, chunk))]),
+                      ('render', lambda item: [(item[0], render_chunk(*item))]),
+                      ('collate', jobs)]
+        runner = Pipeline(stages, workers, written, failed)
+        runner.run(chunks)
+        stats.info['pipeline'] = {metrics.name: metrics.to_dict() for metrics in runner.metrics}
+    else:
+        with ParallelWriter(workers, written, failed) as runner:
+            for item in prepare_chunks(chunks, config, processes, collator.fallback):
+                for key, task, args in jobs(item):
+                    runner.submit(key, task, *args)
+    LOG.flush_repeats()
+    collator.log_summary()
+    LOG.info('set.nfo files: %s', format_counts(outcomes))
+    LOG.info('%s', runner.summary())
+    stats.info['writer'] = {'workers': runner.workers, 'seconds': round(runner.elapsed, 4), 'pipelined': pipelined,
+                            'render_processes': processes}
+    LOG.info('MSIF calls: %d scandir, %d stat, %d mkdir',
+             msif_index.scandir_calls, msif_index.stat_calls, msif_index.mkdir_calls)
+    stats.info['msif_calls'] = {'scandir': msif_index.scandir_calls, 'stat': msif_index.stat_calls,
+                                'mkdir': msif_index.mkdir_calls}
+
+
+def export_archive(source: Iterable[list], kind: str, stats: ExportStats = None, processes: int = 1):
+    """Export every set in source into one file in the MSIF, see lib.archive.
+    The file is written under a temporary name and replaces the previous
+    export only once complete, and only if the library was read in full,
+    including the member movies of every set when set.nfo lists them.
+
+    Args:
+        source (Iterable[list]): Movie set info rows, see get_ET_trees
+        kind (str): ZIP, TAR or XML
+        stats (ExportStats, optional): Collects phase times. Defaults to None.
+        processes (int, optional): Render processes. Defaults to 1 (render in this process).
+    """
+    stats = stats if stats is not None else ExportStats()
+    msif_index = VfsMsifIndex(MSIF_URL) if network else MsifIndex(MSIF)
+    name = ARCHIVE_NAMES[kind]
+    partial = f'{name}.part'
+    collator = SetCollator(stats, msif_index.case_sensitive())
+    rows = iter(source)
+    chunks = iter(lambda: list(islice(rows, SANITIZE_CHUNK)), [])
+    clock = time.perf_counter
+    completed = False
+    try:
+        with msif_index.open_write(partial) as fileobj, open_set_archive(kind, fileobj) as archive:
+            for item in prepare_chunks(chunks, render_config(), processes, collator.fallback):
+                for _row, folder, nfo_data, _digest in collator.collate(item):
+                    started = clock()
+                    archive.add(folder, nfo_data)
+                    stats.add(WRITE, clock() - started)
+        if stats.counters.get('retrieve failed') or stats.counters.get('member movies failed'):
+            LOG.error('the library was not read in full, %s not replaced', msif_index.file_location(name))
+            return
+        msif_index.replace_file(partial, name)
+        completed = True
+    except OSError as err:
+        stats.count('failed')
+        LOG.error('Could not write %s due to %s', msif_index.file_location(name), err)
+        return
+    finally:
+        if not completed:  # whatever stopped the export, no partial file is left in the MSIF
             try:
-                child.text = row[index+1]
-            except IndexError:
-                child.text = ''
-        tree = ET.ElementTree(root)
-        ET.indent(tree, space="\t", level=0)
+                msif_index.remove_file(partial)
+            except OSError:
+                pass
+    LOG.flush_repeats()
+    collator.log_summary()
+    stats.count(CREATED, archive.entries)
+    LOG.info('%d sets written to %s', archive.entries, msif_index.file_location(name))
+    stats.info['archive'] = {'file': msif_index.file_location(name), 'sets': archive.entries}
+
+
+def load_manifest(sif) -> ExportManifest:
+    """Load the export manifest for sif from the addon profile folder
+
+    Args:
+        sif (Path): the MSIF path
+
+    Returns:
+        ExportManifest: the manifest, or None if incremental export is disabled
+    """
+    if not ADDON.getSettingBool('incremental'):
+        return None
+    profile = Path(xbmcvfs.translatePath(ADDON.getAddonInfo('profile')))
+    return ExportManifest.load(profile / MANIFEST_FILENAME, msif_location(sif))
+
+
+def get_movie_sets(page_size: int = 500, stats: ExportStats = None,
+                   fields: frozenset = frozenset()) -> Iterator[list]:
+    """Retrieve the library movie sets page by page with the JSON-RPC limits
+    parameter, so only one page of sets is held in memory at a time.  Member
+    movies are fetched for a whole page in one batched round trip.
+
+    Args:
+        page_size (int, optional): sets per VideoLibrary.GetMovieSets call. Defaults to 500.
+        stats (ExportStats, optional): Records the time of each call. Defaults to None.
+        fields (frozenset, optional): optional set.nfo fields to fetch. Defaults to none.
+
+    Yields:
+        list: movie set info row, see set_row
+    """
+    properties = set_properties(fields)
+    start = 0
+    while True:
+        started = time.perf_counter()
+        try:
+            result = RPC.call('VideoLibrary.GetMovieSets',
+                              {'properties': properties, 'limits': {'start': start, 'end': start + page_size}})
+        except JsonRpcError as err:
+            LOG.error('GetMovieSets failed at set %d: %s', start, err)
+            if stats is not None:
+                stats.count('retrieve failed')
+            break
+        sets = result.get('sets', [])
+        movies = get_set_movies([movie_set.get('setid', 0) for movie_set in sets]) if FIELD_MOVIES in fields else {}
+        if stats is not None:
+            stats.add(RETRIEVE, time.perf_counter() - started, len(sets))
+        for movie_set in sets:
+            setid = movie_set.get('setid', 0)
+            if FIELD_MOVIES in fields and setid not in movies:
+                # exporting without members would overwrite a good set.nfo
+                LOG.repeated('member movies failure', 'could not read the movies of set %s, skipped',
+                             movie_set.get('label', setid))
+                if stats is not None:
+                    stats.count('member movies failed')
+                continue
+            yield set_row(movie_set, fields, movies.get(setid))
+        start += len(sets)
+        if not sets or start >= result.get('limits', {}).get('total', 0):
+            break
+
+
+def movies_param() -> dict:
+    """GetMovieSetDetails 'movies' parameter for the member movies written to set.nfo"""
+    return {'properties': MOVIE_PROPERTIES, 'sort': {'method': 'year'}}
+
+
+def get_set_movies(setids: list[int]) -> dict[int, list]:
+    """Member movies of the sets, one GetMovieSetDetails per set sent as a
+    single batch
+
+    Args:
+        setids (list[int]): library setids
+
+    Returns:
+        dict[int, list]: setid -> movie details, missing for sets that failed
+    """
+    if not setids:
+        return {}
+    try:
+        results = RPC.batch([('VideoLibrary.GetMovieSetDetails', {'setid': setid, 'movies': movies_param()})
+                             for setid in setids])
+    except JsonRpcError as err:
+        LOG.error('GetMovieSetDetails failed: %s', err)
+        return {}
+    return {setid: result['setdetails'].get('movies', []) for setid, result in zip(setids, results)
+            if isinstance(result, dict) and 'setdetails' in result}
+
+
+def get_movie_set_details(setids: list[int], batch_size: int = 500, stats: ExportStats = None,
+                          fields: frozenset = frozenset()) -> Iterator[list]:
+    """Retrieve the listed movie sets with batched VideoLibrary.GetMovieSetDetails
+    calls, batch_size sets per round trip.  Sets no longer in the library are skipped.
+
+    Args:
+        setids (list[int]): library setids
+        batch_size (int, optional): sets per round trip. Defaults to 500.
+        stats (ExportStats, optional): Records the time of each round trip. Defaults to None.
+        fields (frozenset, optional): optional set.nfo fields to fetch. Defaults to none.
+
+    Yields:
+        list: movie set info row, see set_row
+    """
+    params = {'properties': set_properties(fields)}
+    if FIELD_MOVIES in fields:
+        params['movies'] = movies_param()
+    for first in range(0, len(setids), batch_size):
+        batch = setids[first:first + batch_size]
+        started = time.perf_counter()
         try:
-            if not network:  #use Path semantics
-                sani_path:Path = MSIF / sanitize_filepath(
-                    Path(row[1].replace('/', '_')), replacement_text='_', platform="auto", normalize=False)
-                xbmc.log(f'{ADDON_ID} the sani path is {sani_path} and exists {(sani_path).exists()}')
-                (sani_path).mkdir(parents=True, exist_ok=True)  # Path objects don't allow "/"
-                xbmc.log(f'{ADDON_ID} the sani path is {sani_path} and exists after mkdir {(sani_path).exists()}')
-                if overwrite or not (sani_path / 'set.nfo').is_file():
-                    tree.write(sani_path / 'set.nfo',
-                            encoding='utf-8', xml_declaration=True, short_empty_elements=False)
-                    xbmc.log(f'{ADDON_ID} wrote file {sani_path / "set.nfo"} and exists {(sani_path / "set.nfo").exists()}')
-            else:  # use url string semantics
-                url_path:str = urlencode((parsed_url.scheme, parsed_url.netloc, (parsed_url.path + sanitize_filepath(
-                    Path(row[1].replace('/', '_')), replacement_text='_', platform="auto", normalize=False)), '', '', ''))
-                xbmc.log(f'{ADDON_ID} url_path {url_path}')
-
-        except IOError as err:
-            xbmc.log(f'{ADDON_ID} Could not write set.nfo file due to {err}')
-
-def export_set_data(sif: Path = None):
+            results = RPC.batch([('VideoLibrary.GetMovieSetDetails', {'setid': setid, **params}) for setid in batch])
+        except JsonRpcError as err:
+            LOG.error('GetMovieSetDetails failed: %s', err)
+            return
+        if stats is not None:
+            stats.add(RETRIEVE, time.perf_counter() - started, len(batch))
+        for setid, result in zip(batch, results):
+            if isinstance(result, JsonRpcError) or 'setdetails' not in result:
+                LOG.debug('set %d not in the library: %s', setid, result)
+                continue
+            yield set_row({'setid': setid, **result['setdetails']}, fields)
+
+
+def export_set_data(sif: Path = None, setids: list[int] = None, silent: bool = False, processes: int = 1):
     """retrieves set data from library and creates set.nfo
 
     Args:
         sif (Path, optional): Path object for MSIF. Defaults to None.
+        setids (list[int], optional): export only these sets. Defaults to None (all sets).
+        silent (bool, optional): run without dialogs.  Changed set.nfo files are updated if an
+            earlier export wrote them, others only with the service_overwrite setting. Defaults to False.
+        processes (int, optional): render processes, for runs outside Kodi only.  Inside Kodi
+            fork is refused or can deadlock a worker. Defaults to 1 (render in this process).
     """
     if sif:
-        replace_nfo = xbmcgui.Dialog().yesno(
-            ADDON_ID, ADDON.getLocalizedString(32004))  # overwrite yes/no
-        response = simplejson.loads(xbmc.executeJSONRPC(
-            '{"jsonrpc":"2.0", "method":"VideoLibrary.GetMovieSets", "params":{"properties":["title", "plot"]}, "id":1}'))
-        if ('result' in response) and ('sets' in response['result']):
-            lib_rows = []  # list of set property rows (1 row per set)
-            for i in range(response['result']['limits']['total']):
-                lib_rows.append([0, response['result']['sets'][i].get(
-                    'label', ''), response['result']['sets'][i].get('plot', '')])
-            get_ET_trees(lib_rows, overwrite=replace_nfo)
+        target = EXPORT_TARGETS[ADDON.getSettingInt('export_target')]
+        page_size = ADDON.getSettingInt('page_size')
+        fields = nfo_fields()
+        if target:
+            if setids:  # the file holds all sets, so it is always rewritten whole
+                LOG.info('exporting all sets to the %s file', target)
+            export_archive(get_movie_sets(page_size, STATS, fields), target, stats=STATS, processes=processes)
+        else:
+            if silent:  # files the addon did not write are only replaced if the user allowed it
+                replace_nfo = ADDON.getSettingBool('service_overwrite')
+            else:
+                replace_nfo = xbmcgui.Dialog().yesno(
+                    ADDON_ID, ADDON.getLocalizedString(32004))  # overwrite yes/no
+            manifest = load_manifest(sif)
+            if setids:
+                source = get_movie_set_details(setids, page_size, STATS, fields)
+            else:
+                source = get_movie_sets(page_size, STATS, fields)
+            get_ET_trees(source, overwrite=replace_nfo, manifest=manifest,
+                         workers=ADDON.getSettingInt('writer_threads'), stats=STATS,
+                         pipelined=ADDON.getSettingBool('pipeline'), processes=processes,
+                         overwrite_own=silent)
+            if manifest is not None:
+                try:
+                    manifest.save()
+                except OSError as err:
+                    LOG.warning('Could not save export manifest due to %s', err)
+        LOG.info('JSON-RPC %s', RPC.summary())
+        save_report(STATS, sif)
+
+
+def reconcile_msif(sif: Path = None):
+    """Find MSIF folders no library set exports to and, after the user
+    confirms, remove them or archive their set.nfo files and remove them.
+    Folders holding anything besides set.nfo, or with incremental export on
+    a set.nfo the manifest does not record this addon writing, are left alone.
+
+    Args:
+        sif (Path, optional): Path object for MSIF. Defaults to None.
+    """
+    if not sif:
+        return
+    library_folders = set()
+    retrieved = 0
+    rows = iter(get_movie_sets(ADDON.getSettingInt('page_size'), STATS))
+    for chunk in iter(lambda: list(islice(rows, SANITIZE_CHUNK)), []):
+        retrieved += len(chunk)
+        library_folders.update(str(folder) for folder in sanitize_set_titles([row[1] for row in chunk]).results
+                               if folder is not None)
+    if STATS.counters.get('retrieve failed') or not retrieved:
+        # an unreadable library would make every folder look orphaned
+        LOG.error('no movie sets read from the library, nothing removed')
+        xbmcgui.Dialog().ok(ADDON_ID, ADDON.getLocalizedString(32032))
+        return
+    msif_index = scan_msif()
+    if msif_index is None:
+        return
+    manifest = load_manifest(sif)
+    orphans = find_orphans(msif_index, library_folders,
+                           set(manifest.folders().values()) if manifest is not None else None)
+    LOG.info('%d orphaned set folders, %d removable, %d kept', len(orphans), len(orphans.removable),
+             len(orphans.kept))
+    for name in orphans.kept:
+        LOG.debug('orphaned folder %s holds other files or was not written by this addon, kept', name)
+    if not orphans.removable:
+        xbmcgui.Dialog().ok(ADDON_ID, ADDON.getLocalizedString(32030) % len(orphans.kept))
+        return
+    choice = xbmcgui.Dialog().select(ADDON.getLocalizedString(32027) % (len(orphans), len(orphans.kept)),
+                                     [ADDON.getLocalizedString(32028), ADDON.getLocalizedString(32029)])
+    if choice < 0:
+        return
+    if choice == 1:
+        profile = Path(xbmcvfs.translatePath(ADDON.getAddonInfo('profile')))
+        archive = profile / f'orphans-{time.strftime("%Y%m%d-%H%M%S")}.zip'
+        try:
+            LOG.info('archived %d set.nfo files to %s', archive_orphans(msif_index, orphans.removable, archive),
+                     archive)
+        except OSError as err:
+            LOG.error('Could not archive orphaned set folders due to %s, nothing removed', err)
+            xbmcgui.Dialog().ok(ADDON_ID, ADDON.getLocalizedString(32058))
+            return
+    removed, kept, failed = remove_orphans(msif_index, orphans.removable)
+    for name in kept:
+        LOG.debug('orphaned folder %s holds files the listing did not show, kept', name)
+    for name, err in failed:
+        LOG.repeated('remove failure', 'Could not remove folder %s due to %s', name, err)
+    LOG.flush_repeats()
+    LOG.info('removed %d orphaned set folders, %d kept, %d failed', len(removed), len(kept), len(failed))
+    if manifest is not None:
+        removed_folders = set(removed)
+        for setid, folder in manifest.folders().items():
+            if folder in removed_folders:
+                manifest.remove(setid)
+        try:
+            manifest.save()
+        except OSError as err:
+            LOG.warning('Could not save export manifest due to %s', err)
+    xbmcgui.Dialog().notification(ADDON_ID, ADDON.getLocalizedString(32031) % len(removed))
+
+
+def import_msif(sif: Path = None):
+    """Update library sets from the set.nfo files in the MSIF.  Sets are
+    matched to folders by their sanitized title, as in an export, and the
+    title, plot and (if enabled) original title of sets whose set.nfo differs
+    are set with batched VideoLibrary.SetMovieSetDetails calls after the
+    user confirms.  Malformed set.nfo files are skipped.
+
+    Args:
+        sif (Path, optional): Path object for MSIF. Defaults to None.
+    """
+    if not sif:
+        return
+    msif_index = scan_msif()
+    if msif_index is None:
+        return
+    page_size = ADDON.getSettingInt('page_size')
+    fields = nfo_fields() & {FIELD_ORIGINALTITLE}
+    properties = frozenset(['title', 'plot', *fields])
+    changes = []  # (setid, title, SetMovieSetDetails parameters)
+    counts = Counter()
+
+    def parsed(row, nfo):
+        if nfo is None:
+            counts['malformed'] += 1
+            LOG.repeated('malformed set.nfo', 'set.nfo of set %s is malformed, skipped', row[1])
+            return
+        counts['read'] += 1
+        params = set_changes({'title': row[1], 'plot': row[2], 'originaltitle': row[3]}, nfo, properties)
+        if params:
+            changes.append((row[0], row[1], params))
+
+    def unreadable(row, err):
+        counts['unreadable'] += 1
+        LOG.repeated('read failure', 'Could not read the set.nfo of set %s due to %s', row[1], err)
+
+    matched_folders = set()
+    retrieved = 0
+    rows = iter(get_movie_sets(page_size, STATS, fields))
+    with ParallelWriter(ADDON.getSettingInt('writer_threads'), parsed, unreadable) as reader:
+        for chunk in iter(lambda: list(islice(rows, SANITIZE_CHUNK)), []):
+            retrieved += len(chunk)
+            for row, folder in zip(chunk, sanitize_set_titles([row[1] for row in chunk]).results):
+                folder = str(folder) if folder is not None else None
+                if folder is None or folder in matched_folders or not msif_index.has_folder(folder):
+                    continue  # a folder shared by several sets belongs to the first, as in an export
+                matched_folders.add(folder)
+                reader.submit(row, read_set_nfo, msif_index, folder)
+    LOG.flush_repeats()
+    LOG.info('import: %d sets, %d set.nfo files read, %d malformed, %d unreadable, %d sets differ',
+             retrieved, counts['read'], counts['malformed'], counts['unreadable'], len(changes))
+    if not retrieved:  # a partly read library is fine, only the sets read are updated
+        LOG.error('no movie sets read from the library, nothing imported')
+        xbmcgui.Dialog().ok(ADDON_ID, ADDON.getLocalizedString(32046))
+        return
+    if not changes:
+        xbmcgui.Dialog().ok(ADDON_ID, ADDON.getLocalizedString(32047) % counts['read'])
+        return
+    if not xbmcgui.Dialog().yesno(ADDON_ID, ADDON.getLocalizedString(32048) % len(changes)):
+        return
+    updated = failed = 0
+    for first in range(0, len(changes), page_size):
+        batch = changes[first:first + page_size]
+        try:
+            results = RPC.batch([('VideoLibrary.SetMovieSetDetails', {'setid': setid, **params})
+                                 for setid, _title, params in batch])
+        except JsonRpcError as err:
+            LOG.error('SetMovieSetDetails failed: %s', err)
+            failed += len(batch)
+            continue
+        for (setid, title, params), result in zip(batch, results):
+            if isinstance(result, JsonRpcError):
+                failed += 1
+                LOG.repeated('update failure', 'Could not update set %s due to %s', title, result)
+            else:
+                updated += 1
+                LOG.debug('updated set %s %s: %s', setid, title, ', '.join(params))
+    LOG.flush_repeats()
+    LOG.info('import updated %d sets, %d failed', updated, failed)
+    xbmcgui.Dialog().notification(ADDON_ID, ADDON.getLocalizedString(32049) % (updated, failed))
+
+
+def save_report(stats: ExportStats, sif):
+    """Log the phase summary and save the run report to the addon profile folder
+
+    Args:
+        stats (ExportStats): the run's statistics
+        sif (Path): the MSIF path
+    """
+    LOG.info('export %s', stats.summary())
+    stats.info['msif'] = msif_location(sif)
+    stats.info['rpc'] = {'round_trips': RPC.round_trips, 'cached': RPC.cache_hits,
+                         'methods': {method: {'calls': calls, 'seconds': round(seconds, 4)}
+                                     for method, (calls, seconds) in RPC.timings.items()}}
+    profile = Path(xbmcvfs.translatePath(ADDON.getAddonInfo('profile')))
+    try:
+        stats.save(profile / REPORT_FILENAME)
+    except OSError as err:
+        LOG.warning('Could not save export report due to %s', err)
 
 if __name__ == '__main__':
-    if MSIF:
-        export_set_data(sif=MSIF)
-        xbmcgui.Dialog().notification(ADDON_ID, ADDON.getLocalizedString(32002))
+    home = xbmcgui.Window(10000)
+    if MSIF and home.getProperty(RUNNING_PROPERTY):
+        LOG.warning('an export is already running')
+    elif MSIF:
+        home.setProperty(RUNNING_PROPERTY, 'true')
+        try:
+            if RECONCILE:
+                reconcile_msif(sif=MSIF)
+            elif IMPORT:
+                import_msif(sif=MSIF)
+            else:
+                export_set_data(sif=MSIF, setids=SETIDS, silent=SILENT)
+        finally:
+            home.clearProperty(RUNNING_PROPERTY)
+        if not SILENT and not RECONCILE and not IMPORT:
+            xbmcgui.Dialog().notification(ADDON_ID, ADDON.getLocalizedString(32002))
@@ -0,0 +1,154 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+#    Copyright (C) 2025 Scott Smart
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+""" Consolidated export targets: every set in one file instead of a folder
+per set.  A zip or tar archive holds a <folder>/set.nfo entry per set, laid
+out like the MSIF; the XML target is one document with a <set> element per
+set.  Entries are streamed as sets are rendered, so the file object only
+needs write(): the tar is written as a stream and the zip with data
+descriptors when the file cannot seek, as with xbmcvfs files.
+"""
+
+import abc
+import io
+import tarfile
+import time
+import zipfile
+
+from lib.msif import NFO_NAME
+from lib.nfo import XML_DECLARATION, escape_attrib
+
+ZIP = 'zip'
+TAR = 'tar'
+XML = 'xml'
+ARCHIVE_NAMES = {ZIP: 'movie_sets.zip', TAR: 'movie_sets.tar', XML: 'movie_sets.xml'}
+
+_SET_START = b'<set>'
+_SET_EMPTY = b'<set></set>'
+
+
+class SetArchive(abc.ABC):
+    """Writes set.nfo documents into one file
+
+    Args:
+        fileobj: writable binary file object
+    """
+
+    def __init__(self, fileobj):
+        self.fileobj = fileobj
+        self.entries = 0
+
+    def __enter__(self) -> 'SetArchive':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @abc.abstractmethod
+    def add(self, folder: str, data: bytes):
+        """Add a set
+
+        Args:
+            folder (str): sanitized set folder name
+            data (bytes): the rendered set.nfo
+
+        Raises:
+            OSError: the file could not be written
+        """
+
+    @abc.abstractmethod
+    def close(self):
+        """Finish the file.  The file object itself is left open."""
+
+
+class ZipSetArchive(SetArchive):
+    """Deflated zip of <folder>/set.nfo entries"""
+
+    def __init__(self, fileobj):
+        super().__init__(fileobj)
+        self._zip = zipfile.ZipFile(fileobj, 'w', compression=zipfile.ZIP_DEFLATED)
+        self._date_time = time.localtime()[:6]
+
+    def add(self, folder: str, data: bytes):
+        info = zipfile.ZipInfo(f'{folder}/{NFO_NAME}', self._date_time)
+        info.compress_type = zipfile.ZIP_DEFLATED
+        self._zip.writestr(info, data)
+        self.entries += 1
+
+    def close(self):
+        self._zip.close()
+
+
+class TarSetArchive(SetArchive):
+    """Uncompressed tar stream of <folder>/set.nfo entries"""
+
+    def __init__(self, fileobj):
+        super().__init__(fileobj)
+        self._tar = tarfile.open(fileobj=fileobj, mode='w|', format=tarfile.PAX_FORMAT)
+        self._mtime = int(time.time())
+
+    def add(self, folder: str, data: bytes):
+        info = tarfile.TarInfo(f'{folder}/{NFO_NAME}')
+        info.size = len(data)
+        info.mtime = self._mtime
+        self._tar.addfile(info, io.BytesIO(data))
+        self.entries += 1
+
+    def close(self):
+        self._tar.close()
+
+
+class XmlSetArchive(SetArchive):
+    """One <sets> document.  Each set.nfo is copied in as rendered, with
+    its folder name as an attribute of <set>, so the set elements are the
+    same as in the set.nfo files.
+    """
+
+    def __init__(self, fileobj):
+        super().__init__(fileobj)
+        self._declaration = XML_DECLARATION.encode('utf-8')
+        fileobj.write(self._declaration + b'<sets>\n')
+
+    def add(self, folder: str, data: bytes):
+        body = data[len(self._declaration):] if data.startswith(self._declaration) else data
+        start = f'<set folder="{escape_attrib(folder)}">'.encode('utf-8')
+        if body == _SET_EMPTY:
+            body = start + b'</set>'
+        else:
+            body = start + body[len(_SET_START):]
+        self.fileobj.write(body + b'\n')
+        self.entries += 1
+
+    def close(self):
+        self.fileobj.write(b'</sets>\n')
+
+
+ARCHIVES = {ZIP: ZipSetArchive, TAR: TarSetArchive, XML: XmlSetArchive}
+
+
+def open_set_archive(kind: str, fileobj) -> SetArchive:
+    """Start a consolidated export in fileobj
+
+    Args:
+        kind (str): ZIP, TAR or XML
+        fileobj: writable binary file object
+
+    Returns:
+        SetArchive: the writer
+    """
+    return ARCHIVES[kind](fileobj)
@@ -0,0 +1,99 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+#    Copyright (C) 2025 Scott Smart
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+""" Reading set.nfo files back into the library.  Each file is parsed with
+a pull parser that stops at the closing </set>, so only the top-level
+fields are kept and anything after the document is ignored.  A malformed
+or truncated file gives None instead of raising.
+"""
+
+import xml.etree.ElementTree as ET
+from typing import Optional
+
+# set.nfo element -> VideoLibrary.SetMovieSetDetails parameter
+NFO_PROPERTIES = {'title': 'title', 'overview': 'plot', 'originaltitle': 'originaltitle'}
+FEED_SIZE = 16384  # bytes handed to the parser at a time
+
+
+def parse_set_nfo(data: bytes) -> Optional[dict]:
+    """The title, overview and originaltitle of a set.nfo
+
+    Args:
+        data (bytes): the set.nfo content
+
+    Returns:
+        Optional[dict]: element -> stripped text of the fields present, None if
+            the document is malformed or its root is not <set>
+    """
+    parser = ET.XMLPullParser(events=('start', 'end'))
+    fields = {}
+    depth = 0
+    try:
+        for offset in range(0, len(data), FEED_SIZE):
+            parser.feed(data[offset:offset + FEED_SIZE])
+            for event, elem in parser.read_events():
+                if event == 'start':
+                    depth += 1
+                    if depth == 1 and elem.tag != 'set':
+                        return None
+                    continue
+                if depth == 2 and elem.tag in NFO_PROPERTIES:
+                    fields[elem.tag] = (elem.text or '').strip()
+                depth -= 1
+                if depth == 0:
+                    return fields
+        parser.close()
+    except ET.ParseError:
+        return None
+    return None  # no root element
+
+
+def read_set_nfo(msif_index, folder: str) -> Optional[dict]:
+    """Read and parse a folder's set.nfo, see parse_set_nfo
+
+    Args:
+        msif_index (MsifIndex or VfsMsifIndex): the MSIF
+        folder (str): set folder name
+
+    Raises:
+        OSError: the file could not be read
+    """
+    return parse_set_nfo(msif_index.read_nfo(folder))
+
+
+def set_changes(current: dict, nfo: dict, properties: frozenset) -> dict:
+    """SetMovieSetDetails parameters for the set.nfo fields that differ from
+    the library.  An empty or missing set.nfo field never blanks a library one.
+
+    Args:
+        current (dict): the set's library values by parameter, e.g. {'title': ..., 'plot': ...}
+        nfo (dict): parse_set_nfo result
+        properties (frozenset): parameters that may be set
+
+    Returns:
+        dict: parameter -> new value, empty if the set matches
+    """
+    return {prop: nfo[tag] for tag, prop in NFO_PROPERTIES.items()
+            if prop in properties and nfo.get(tag) and nfo[tag] != _as_parsed(current.get(prop) or '')}
+
+
+def _as_parsed(text: str) -> str:
+    """text as it reads back from an exported set.nfo: XML parsers turn line
+    ends into newlines, and parse_set_nfo strips the text
+    """
+    return text.replace('\r\n', '\n').replace('\r', '\n').strip()
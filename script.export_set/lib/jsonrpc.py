@@ -0,0 +1,183 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+#    Copyright (C) 2025 Scott Smart
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+""" Kodi JSON-RPC client.  Requests are built with json.dumps, several
+requests can be sent as one JSON-RPC 2.0 batch array in a single
+executeJSONRPC round trip, and responses of idempotent methods are
+memoized for the life of the client (one addon run).  Every round trip
+is timed per method.
+
+The execute function is passed in so the client can be exercised outside
+Kodi; it defaults to xbmc.executeJSONRPC.
+"""
+
+import json
+import time
+from typing import Callable, Optional
+
+# read-only methods whose responses do not change during an export run
+IDEMPOTENT_METHODS = frozenset({
+    'JSONRPC.Version',
+    'Settings.GetSettingValue',
+    'Application.GetProperties',
+})
+
+
+class JsonRpcError(Exception):
+    """A JSON-RPC call failed or its response could not be decoded
+
+    Args:
+        method (str): the method called
+        message (str): error message
+        code (int, optional): JSON-RPC error code, None if the response was unusable
+    """
+
+    def __init__(self, method: str, message: str, code: Optional[int] = None):
+        super().__init__(f'{method}: {message}' if code is None else f'{method}: {message} ({code})')
+        self.method = method
+        self.message = message
+        self.code = code
+
+
+class JsonRpcClient:
+    """JSON-RPC 2.0 client for one addon run
+
+    Args:
+        execute (Callable, optional): sends a request string and returns the
+            response string. Defaults to xbmc.executeJSONRPC.
+    """
+
+    def __init__(self, execute: Callable[[str], str] = None):
+        if execute is None:
+            import xbmc  # pylint: disable=import-outside-toplevel
+            execute = xbmc.executeJSONRPC
+        self._execute = execute
+        self._cache: dict[str, object] = {}
+        self._next_id = 1
+        self.round_trips = 0
+        self.cache_hits = 0
+        self.timings: dict[str, list] = {}  # method -> [calls, seconds]
+
+    def call(self, method: str, params: dict = None, cache: Optional[bool] = None):
+        """Call one method
+
+        Args:
+            method (str): JSON-RPC method, e.g. 'VideoLibrary.GetMovieSets'
+            params (dict, optional): method parameters
+            cache (bool, optional): memoize the result.  Defaults to True for
+                IDEMPOTENT_METHODS.
+
+        Raises:
+            JsonRpcError: Kodi returned an error or an unusable response
+
+        Returns:
+            the response 'result' member
+        """
+        result = self.batch([(method, params)], cache=cache)[0]
+        if isinstance(result, JsonRpcError):
+            raise result
+        return result
+
+    def batch(self, calls: list, cache: Optional[bool] = None) -> list:
+        """Call several methods in one round trip.  Memoized calls are answered
+        from the cache and left out of the request; nothing is sent when every
+        call is memoized.
+
+        Args:
+            calls (list[tuple[str, dict]]): (method, params) pairs.  params may be None.
+            cache (bool, optional): memoize the results.  Defaults to True for
+                IDEMPOTENT_METHODS.
+
+        Raises:
+            JsonRpcError: the whole batch failed, e.g. the response was not json
+
+        Returns:
+            list: the 'result' member for each call, in call order, or a
+            JsonRpcError for a call Kodi rejected
+        """
+        results: list = [None] * len(calls)
+        requests = []
+        pending = {}  # request id -> (call index, cache key)
+        for index, (method, params) in enumerate(calls):
+            key = None
+            if cache or (cache is None and method in IDEMPOTENT_METHODS):
+                key = json.dumps([method, params], sort_keys=True, separators=(',', ':'))
+                if key in self._cache:
+                    self.cache_hits += 1
+                    results[index] = self._cache[key]
+                    continue
+            request = {'jsonrpc': '2.0', 'method': method, 'id': self._next_id}
+            if params is not None:
+                request['params'] = params
+            requests.append(request)
+            pending[self._next_id] = (index, key)
+            self._next_id += 1
+        if not requests:
+            return results
+        # a single request is sent as an object, Kodi answers arrays with arrays
+        payload = requests[0] if len(requests) == 1 else requests
+        responses = self._send(payload, [request['method'] for request in requests])
+        for response in responses if isinstance(responses, list) else [responses]:
+            if not isinstance(response, dict) or response.get('id') not in pending:
+                continue
+            index, key = pending.pop(response['id'])
+            method = calls[index][0]
+            if 'error' in response:
+                error = response['error'] if isinstance(response['error'], dict) else {}
+                results[index] = JsonRpcError(method, error.get('message', 'error'), error.get('code'))
+            elif 'result' in response:
+                results[index] = response['result']
+                if key is not None:
+                    self._cache[key] = response['result']
+            else:
+                results[index] = JsonRpcError(method, 'response has no result')
+        for index, _key in pending.values():  # no response for the request
+            results[index] = JsonRpcError(calls[index][0], 'no response')
+        return results
+
+    def clear_cache(self):
+        """Forget memoized results"""
+        self._cache.clear()
+
+    def summary(self) -> str:
+        """One line call timing summary
+
+        Returns:
+            str: e.g. '3 round trips, 1 cached: VideoLibrary.GetMovieSets 2 in 0.120s, ...'
+        """
+        methods = ', '.join(f'{method} {calls} in {seconds:.3f}s'
+                            for method, (calls, seconds) in sorted(self.timings.items()))
+        return f'{self.round_trips} round trips, {self.cache_hits} cached: {methods or "no calls"}'
+
+    def _send(self, payload, methods: list):
+        label = methods[0] if len(methods) == 1 else 'batch'
+        started = time.perf_counter()
+        try:
+            raw = self._execute(json.dumps(payload, separators=(',', ':')))
+        finally:
+            elapsed = time.perf_counter() - started
+            self.round_trips += 1
+            # a batch's time is split evenly over its calls
+            for method in methods:
+                timing = self.timings.setdefault(method, [0, 0.0])
+                timing[0] += 1
+                timing[1] += elapsed / len(methods)
+        try:
+            return json.loads(raw)
+        except (TypeError, ValueError) as err:
+            raise JsonRpcError(label, f'invalid response {err}') from err
@@ -0,0 +1,110 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+#    Copyright (C) 2025 Scott Smart
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+""" Logging facade over xbmc.log.  Messages take %-style arguments that are
+only formatted when the line is written, and debug lines are dropped
+before any formatting unless Kodi debug logging is on, so per-set debug
+lines cost one attribute test in a normal run.  Warnings that can repeat
+for many sets are counted and only the first few are written.
+"""
+
+from typing import Callable
+
+# Kodi log levels, as in xbmc
+LOGDEBUG = 0
+LOGINFO = 1
+LOGWARNING = 2
+LOGERROR = 3
+
+
+class Lazy:
+    """Argument computed only if the message is written, e.g.
+    log.debug('%s', Lazy(index.nfo_location, folder))
+
+    Args:
+        func (Callable): computes the value
+    """
+
+    __slots__ = ('func', 'args')
+
+    def __init__(self, func: Callable, *args):
+        self.func = func
+        self.args = args
+
+    def __str__(self) -> str:
+        return str(self.func(*self.args))
+
+
+class Logger:
+    """Prefixes messages with the addon id
+
+    Args:
+        prefix (str): the addon id
+        debug (bool, optional): write debug lines. Defaults to False.
+        log (Callable, optional): log(message, level). Defaults to xbmc.log.
+        repeat_limit (int, optional): lines written per repeated warning. Defaults to 10.
+    """
+
+    def __init__(self, prefix: str, debug: bool = False, log: Callable = None, repeat_limit: int = 10):
+        if log is None:
+            import xbmc  # pylint: disable=import-outside-toplevel
+            log = xbmc.log
+        self._log = log
+        self.prefix = prefix
+        self.debug_enabled = debug
+        self.repeat_limit = repeat_limit
+        self.repeats: dict[str, int] = {}
+
+    def _write(self, level: int, msg: str, args: tuple):
+        if args:
+            msg = msg % tuple(str(arg) if isinstance(arg, Lazy) else arg for arg in args)
+        self._log(f'{self.prefix} {msg}', level)
+
+    def debug(self, msg: str, *args):
+        """Write a debug line if Kodi debug logging is on"""
+        if self.debug_enabled:
+            self._write(LOGDEBUG, msg, args)
+
+    def info(self, msg: str, *args):
+        self._write(LOGINFO, msg, args)
+
+    def warning(self, msg: str, *args):
+        self._write(LOGWARNING, msg, args)
+
+    def error(self, msg: str, *args):
+        self._write(LOGERROR, msg, args)
+
+    def repeated(self, key: str, msg: str, *args):
+        """Warning that can occur for many sets.  The first repeat_limit are
+        written, later ones only counted, see flush_repeats.
+
+        Args:
+            key (str): kind of warning, e.g. 'folder collision'
+            msg (str): message
+        """
+        count = self.repeats.get(key, 0) + 1
+        self.repeats[key] = count
+        if count <= self.repeat_limit or self.debug_enabled:
+            self._write(LOGWARNING, msg, args)
+
+    def flush_repeats(self):
+        """Log how many repeated warnings were not written, and reset the counts"""
+        for key, count in self.repeats.items():
+            if count > self.repeat_limit and not self.debug_enabled:
+                self._write(LOGWARNING, '%d %s warnings, %d not logged', (count, key, count - self.repeat_limit))
+        self.repeats.clear()
@@ -0,0 +1,155 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+#    Copyright (C) 2025 Scott Smart
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+""" Persistent per-set record of the set.nfo files written by previous
+exports.  The manifest maps a library setid to the sanitized MSIF folder
+and a digest of the rendered set.nfo so an export run can skip sets whose
+exported content has not changed.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from lib.vfs import redact_url
+
+MANIFEST_VERSION = 1
+MANIFEST_FILENAME = 'manifest.json'
+
+
+def content_digest(data: bytes) -> str:
+    """Digest of a rendered set.nfo
+
+    Args:
+        data (bytes): the set.nfo file content
+
+    Returns:
+        str: hex digest
+    """
+    return hashlib.sha256(data).hexdigest()
+
+
+class ExportManifest:
+    """setid -> (sanitized folder, set.nfo digest) for one MSIF
+
+    Args:
+        path (Path): the manifest json file
+        msif (str): the MSIF the manifest entries refer to
+    """
+
+    def __init__(self, path: Path, msif: str):
+        self.path = path
+        self.msif = msif
+        self._entries: dict[str, dict[str, str]] = {}
+        self._dirty = False
+
+    @classmethod
+    def load(cls, path: Path, msif: str) -> 'ExportManifest':
+        """Read a manifest.  A missing or unreadable file, or a manifest
+        built for another MSIF, gives an empty manifest so every set is
+        exported.  Manifests saved before credentials were stripped from
+        network MSIF urls still match.
+
+        Args:
+            path (Path): the manifest json file
+            msif (str): the current MSIF, without credentials
+
+        Returns:
+            ExportManifest: the manifest
+        """
+        manifest = cls(path, msif)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return manifest
+        if (isinstance(data, dict) and data.get('version') == MANIFEST_VERSION
+                and redact_url(str(data.get('msif'))) == msif and isinstance(data.get('sets'), dict)):
+            manifest._entries = data['sets']
+        return manifest
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, setid) -> bool:
+        return str(setid) in self._entries
+
+    def is_current(self, setid, folder: str, digest: str) -> bool:
+        """True if the set was last exported to folder with the same content
+
+        Args:
+            setid (int): library setid
+            folder (str): sanitized set folder name
+            digest (str): digest of the rendered set.nfo
+        """
+        entry = self._entries.get(str(setid))
+        return entry is not None and entry.get('folder') == folder and entry.get('digest') == digest
+
+    def wrote(self, setid, folder: str) -> bool:
+        """True if the set was last exported to folder, whatever its content
+
+        Args:
+            setid (int): library setid
+            folder (str): sanitized set folder name
+        """
+        entry = self._entries.get(str(setid))
+        return entry is not None and entry.get('folder') == folder
+
+    def update(self, setid, folder: str, digest: str):
+        """Record a set.nfo as written
+
+        Args:
+            setid (int): library setid
+            folder (str): sanitized set folder name
+            digest (str): digest of the written set.nfo
+        """
+        entry = {'folder': folder, 'digest': digest}
+        if self._entries.get(str(setid)) != entry:
+            self._entries[str(setid)] = entry
+            self._dirty = True
+
+    def remove(self, setid):
+        """Forget a set
+
+        Args:
+            setid (int): library setid
+        """
+        if self._entries.pop(str(setid), None) is not None:
+            self._dirty = True
+
+    def folders(self) -> dict[str, str]:
+        """setid -> sanitized folder for every recorded set"""
+        return {setid: entry.get('folder', '') for setid, entry in self._entries.items()}
+
+    def save(self):
+        """Write the manifest if it changed.  The file is replaced atomically
+        so an interrupted run leaves the previous manifest intact.
+
+        Raises:
+            OSError: the manifest could not be written
+        """
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': MANIFEST_VERSION, 'msif': self.msif, 'sets': self._entries},
+                      f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, self.path)
+        self._dirty = False
@@ -0,0 +1,308 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+#    Copyright (C) 2025 Scott Smart
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+""" In-memory index of a local MSIF built from a single directory scan, so
+an export only issues filesystem calls for folders and files it actually
+has to create or compare.
+
+An MSIF index provides has_folder, nfo_size, ensure_folder, read_nfo,
+write_nfo, create_nfo, nfo_location, folder_entries, remove_folder,
+case_sensitive, and open_write and replace_file for files in the MSIF
+itself; lib.vfs.VfsMsifIndex is the same interface for MSIFs on smb://
+and nfs:// shares.
+"""
+
+import errno
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional
+
+NFO_NAME = 'set.nfo'
+REMOVING_NAME = f'.{NFO_NAME}.removing'  # in the MSIF, a set.nfo moved aside while its folder is removed
+
+
+class MsifIndex:
+    """Set folders present in the MSIF
+
+    Args:
+        root (Path): the MSIF
+        folders (set[str], optional): names of the existing set folders
+    """
+
+    def __init__(self, root: Path, folders: set = None):
+        self.root = root
+        self._folders: set[str] = set() if folders is None else folders
+        self._lock = threading.Lock()  # writer threads share the index
+        self.scandir_calls = 0
+        self.stat_calls = 0
+        self.mkdir_calls = 0
+
+    @classmethod
+    def scan(cls, root: Path) -> 'MsifIndex':
+        """List the MSIF once.  A missing MSIF gives an empty index; it is
+        created with the first set folder.
+
+        Args:
+            root (Path): the MSIF
+
+        Raises:
+            OSError: the MSIF exists but could not be listed
+
+        Returns:
+            MsifIndex: the index
+        """
+        folders = set()
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        folders.add(entry.name)
+        except FileNotFoundError:
+            pass
+        index = cls(root, folders)
+        index.scandir_calls = 1
+        return index
+
+    def __len__(self) -> int:
+        return len(self._folders)
+
+    def folders(self) -> set:
+        """Names of all set folders in the MSIF"""
+        return set(self._folders)
+
+    def case_sensitive(self) -> bool:
+        """True if the MSIF's file system tells names apart by case.  Probed
+        by looking the MSIF up with the case of its name swapped.  A name
+        without letters cannot be probed and is taken as case-insensitive.
+        """
+        swapped = self.root.with_name(self.root.name.swapcase())
+        if swapped == self.root:
+            return False
+        try:
+            return not os.path.samefile(self.root, swapped)
+        except OSError:
+            return True
+
+    def has_folder(self, name: str) -> bool:
+        """True if the MSIF held the set folder when scanned, or it was created since
+
+        Args:
+            name (str): sanitized set folder name
+        """
+        return name in self._folders
+
+    def nfo_size(self, name: str) -> Optional[int]:
+        """Size of the folder's set.nfo.  Costs one stat, and none at all for a
+        folder that does not exist.
+
+        Args:
+            name (str): sanitized set folder name
+
+        Returns:
+            Optional[int]: size in bytes, None if there is no set.nfo
+        """
+        if name not in self._folders:
+            return None
+        with self._lock:
+            self.stat_calls += 1
+        try:
+            return (self.root / name / NFO_NAME).stat().st_size
+        except FileNotFoundError:
+            return None
+
+    def ensure_folder(self, name: str) -> Path:
+        """Create the set folder unless the index knows it exists
+
+        Args:
+            name (str): sanitized set folder name
+
+        Raises:
+            OSError: the folder could not be created
+
+        Returns:
+            Path: the set folder
+        """
+        path = self.root / name
+        if name not in self._folders:
+            path.mkdir(parents=True, exist_ok=True)
+            with self._lock:
+                self.mkdir_calls += 1
+                self._folders.add(name)
+        return path
+
+    def read_nfo(self, name: str) -> bytes:
+        """Content of the folder's set.nfo
+
+        Args:
+            name (str): sanitized set folder name
+
+        Raises:
+            OSError: the file could not be read
+        """
+        return (self.root / name / NFO_NAME).read_bytes()
+
+    def write_nfo(self, name: str, data: bytes):
+        """Replace the folder's set.nfo.  The content goes to a temporary
+        file that is renamed over set.nfo, so overlapping writers never
+        leave a mix of two documents.
+
+        Args:
+            name (str): sanitized set folder name
+            data (bytes): the set.nfo content
+
+        Raises:
+            OSError: the file could not be written
+        """
+        fd, tmp_path = tempfile.mkstemp(prefix=f'.{NFO_NAME}.', suffix='.tmp', dir=self.root / name)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self.root / name / NFO_NAME)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def create_nfo(self, name: str, data: bytes) -> bool:
+        """Write the folder's set.nfo unless it exists, in one exclusive create
+        (O_CREAT|O_EXCL), so a set.nfo made by another writer is never replaced.
+        The folder is assumed to exist; it is only created when the create
+        fails with ENOENT.
+
+        Args:
+            name (str): sanitized set folder name
+            data (bytes): the set.nfo content
+
+        Raises:
+            OSError: the folder or file could not be created or written
+
+        Returns:
+            bool: True if written, False if the folder already had a set.nfo
+        """
+        path = self.root / name / NFO_NAME
+        try:
+            try:
+                with open(path, 'xb') as f:
+                    f.write(data)
+            except FileNotFoundError:  # removed since the scan, or never there
+                with self._lock:
+                    self._folders.discard(name)
+                self.ensure_folder(name)
+                with open(path, 'xb') as f:
+                    f.write(data)
+        except FileExistsError:
+            return False
+        return True
+
+    def nfo_location(self, name: str) -> str:
+        """The folder's set.nfo for log messages
+
+        Args:
+            name (str): sanitized set folder name
+        """
+        return str(self.root / name / NFO_NAME)
+
+    def folder_entries(self, name: str) -> list[str]:
+        """Names in a set folder, subfolders with a trailing '/'
+
+        Args:
+            name (str): set folder name
+
+        Raises:
+            OSError: the folder could not be listed
+        """
+        with os.scandir(self.root / name) as entries:
+            return [entry.name + '/' if entry.is_dir() else entry.name for entry in entries]
+
+    def remove_folder(self, name: str) -> bool:
+        """Remove a set folder holding only its set.nfo.  The set.nfo is
+        moved aside first and put back if the folder cannot be removed, so a
+        folder holding files the listing missed keeps its set.nfo.
+
+        Args:
+            name (str): set folder name
+
+        Raises:
+            OSError: the file or folder could not be removed
+
+        Returns:
+            bool: True if removed, False if the folder was not empty and was left as it was
+        """
+        path = self.root / name
+        aside = self.root / REMOVING_NAME
+        try:
+            os.replace(path / NFO_NAME, aside)
+            moved = True
+        except FileNotFoundError:
+            moved = False
+        try:
+            path.rmdir()
+        except OSError as err:
+            if moved:
+                os.replace(aside, path / NFO_NAME)
+            if err.errno in (errno.ENOTEMPTY, errno.EEXIST):
+                return False
+            raise
+        if moved:
+            aside.unlink()
+        with self._lock:
+            self._folders.discard(name)
+        return True
+
+    def open_write(self, name: str):
+        """Open a file in the MSIF for writing, creating the MSIF if needed
+
+        Args:
+            name (str): file name
+
+        Raises:
+            OSError: the file could not be created
+
+        Returns:
+            binary file object
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        return open(self.root / name, 'wb')  # pylint: disable=consider-using-with
+
+    def replace_file(self, source: str, target: str):
+        """Rename a file in the MSIF over another
+
+        Args:
+            source (str): file name
+            target (str): file name, replaced if it exists
+
+        Raises:
+            OSError: the file could not be renamed
+        """
+        os.replace(self.root / source, self.root / target)
+
+    def remove_file(self, name: str):
+        """Delete a file in the MSIF if it exists
+
+        Args:
+            name (str): file name
+
+        Raises:
+            OSError: the file could not be removed
+        """
+        (self.root / name).unlink(missing_ok=True)
+
+    def file_location(self, name: str) -> str:
+        """A file in the MSIF for log messages"""
+        return str(self.root / name)
@@ -4,6 +4,8 @@
 
 from .__version__ import __author__, __copyright__, __email__, __license__, __version__
 from ._base import AbstractSanitizer, AbstractValidator
+from ._batch import SanitizeReport, ValidationReport, sanitize_filepaths, validate_filepaths
+from ._cache import CacheInfo, clear_instance_cache, instance_cache_info
 from ._common import (
     ascii_symbols,
     normalize_platform,
@@ -37,6 +39,7 @@ from .error import (
     NullNameError,
     ReservedNameError,
     ValidationError,
+    ValidationResult,
     ValidReservedNameError,
 )
 
@@ -49,6 +52,9 @@ __all__ = (
     "__version__",
     "AbstractSanitizer",
     "AbstractValidator",
+    "CacheInfo",
+    "clear_instance_cache",
+    "instance_cache_info",
     "Platform",
     "ascii_symbols",
     "normalize_platform",
@@ -67,6 +73,10 @@ __all__ = (
     "is_valid_filepath",
     "sanitize_filepath",
     "validate_filepath",
+    "SanitizeReport",
+    "ValidationReport",
+    "sanitize_filepaths",
+    "validate_filepaths",
     "sanitize_ltsv_label",
     "validate_ltsv_label",
     "replace_symbol",
@@ -77,5 +87,6 @@ __all__ = (
     "NullNameError",
     "ReservedNameError",
     "ValidationError",
+    "ValidationResult",
     "ValidReservedNameError",
 )
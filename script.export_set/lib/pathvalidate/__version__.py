@@ -4,6 +4,9 @@ from typing import Final
 __author__: Final = "Tsuyoshi Hombashi"
 __copyright__: Final = f"Copyright 2016-2025, {__author__}"
 __license__: Final = "MIT License"
-__version__ = "3.3.1"
+# pathvalidate 3.3.1 as modified for script.export_set: instance and result
+# caches, batch sanitize/validate, check() and a translate-based sanitizer.
+# Not an upstream release.
+__version__ = "3.3.1+exportset"
 __maintainer__: Final = __author__
 __email__: Final = "tsuyoshi.hombashi@gmail.com"
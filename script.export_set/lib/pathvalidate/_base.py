@@ -7,12 +7,14 @@ import os
 import re
 import sys
 from collections.abc import Sequence
-from typing import Final, Optional
+from pathlib import PurePath
+from typing import Callable, Final, Optional
 
+from ._cache import CacheInfo, LRUCache
 from ._common import normalize_platform, unprintable_ascii_chars
 from ._const import DEFAULT_MIN_LEN, Platform
 from ._types import PathType, PlatformType
-from .error import ReservedNameError, ValidationError
+from .error import VALID_RESULT, ErrorReason, ReservedNameError, ValidationError, ValidationResult
 from .handler import NullValueHandler, ReservedNameHandler, ValidationErrorHandler
 
 
@@ -122,6 +124,15 @@ class AbstractValidator(BaseFile, metaclass=abc.ABCMeta):
             platform=platform,
         )
 
+        # reserved names only depend on the platform and the additional names:
+        # resolve them once instead of on every lookup
+        self.__reserved_keywords = self._get_reserved_keywords()
+        self.__reserved_keyword_set = frozenset(self.__reserved_keywords)
+
+    @property
+    def reserved_keywords(self) -> tuple[str, ...]:
+        return self.__reserved_keywords
+
     @property
     @abc.abstractmethod
     def min_len(self) -> int:  # pragma: no cover
@@ -131,16 +142,38 @@ class AbstractValidator(BaseFile, metaclass=abc.ABCMeta):
     def validate(self, value: PathType) -> None:  # pragma: no cover
         pass
 
-    def is_valid(self, value: PathType) -> bool:
+    def check(self, value: PathType) -> ValidationResult:
+        """Validate ``value`` without raising on invalid values.
+
+        Subclasses that can locate errors without exceptions override this and
+        implement :py:meth:`validate` on top of it.
+
+        Returns:
+            ValidationResult: The outcome of the validation.
+
+        Raises:
+            TypeError: If ``value`` is neither a string nor a path.
+        """
+
         try:
             self.validate(value)
-        except (TypeError, ValidationError):
+        except ValidationError as e:
+            error = e
+            return ValidationResult(error.reason, error_factory=lambda: error)
+
+        return VALID_RESULT
+
+    def is_valid(self, value: PathType) -> bool:
+        try:
+            return self.check(value).ok
+        except TypeError:
             return False
 
-        return True
+    def _get_reserved_keywords(self) -> tuple[str, ...]:
+        return self._additional_reserved_names
 
     def _is_reserved_keyword(self, value: str) -> bool:
-        return value.upper() in self.reserved_keywords
+        return value.upper() in self.__reserved_keyword_set
 
 
 class AbstractSanitizer(BaseFile, metaclass=abc.ABCMeta):
@@ -155,6 +188,7 @@ class AbstractSanitizer(BaseFile, metaclass=abc.ABCMeta):
         additional_reserved_names: Optional[Sequence[str]] = None,
         platform_max_len: Optional[int] = None,
         platform: Optional[PlatformType] = None,
+        cache_size: int = 0,
     ) -> None:
         super().__init__(
             max_len=max_len,
@@ -164,6 +198,12 @@ class AbstractSanitizer(BaseFile, metaclass=abc.ABCMeta):
             platform=platform,
         )
 
+        if cache_size < 0:
+            raise ValueError("cache_size must be greater or equal to zero")
+        self.__result_cache: Optional[LRUCache[PathType]] = (
+            LRUCache(cache_size) if cache_size > 0 else None
+        )
+
         if null_value_handler is None:
             null_value_handler = NullValueHandler.return_null_string
         self._null_value_handler = null_value_handler
@@ -180,6 +220,33 @@ class AbstractSanitizer(BaseFile, metaclass=abc.ABCMeta):
     def sanitize(self, value: PathType, replacement_text: str = "") -> PathType:  # pragma: no cover
         pass
 
+    def result_cache_info(self) -> Optional[CacheInfo]:
+        """Return statistics of the sanitization result cache.
+
+        Returns:
+            Optional[CacheInfo]: |None| if the sanitizer was created with ``cache_size=0``.
+        """
+
+        if self.__result_cache is None:
+            return None
+
+        return self.__result_cache.cache_info()
+
+    def _sanitize_with_cache(
+        self,
+        sanitize_func: Callable[[PathType, str], PathType],
+        value: PathType,
+        replacement_text: str,
+    ) -> PathType:
+        if self.__result_cache is None or not isinstance(value, (str, PurePath)):
+            return sanitize_func(value, replacement_text)
+
+        # str and PurePath inputs differ in return type and null value handling
+        return self.__result_cache.get_or_create(
+            (isinstance(value, PurePath), str(value), replacement_text),
+            lambda: sanitize_func(value, replacement_text),
+        )
+
 
 class BaseValidator(AbstractValidator):
     __RE_ROOT_NAME: Final = re.compile(r"([^\.]+)")
@@ -215,20 +282,36 @@ class BaseValidator(AbstractValidator):
         self._validate_max_len()
 
     def _validate_reserved_keywords(self, name: str) -> None:
+        self._check_reserved_keywords(name).raise_for_error()
+
+    def _check_reserved_keywords(self, name: str) -> ValidationResult:
         if not self._check_reserved:
-            return
+            return VALID_RESULT
 
         root_name = self.__extract_root_name(name)
         base_name = os.path.basename(name)
 
-        for name in (root_name, base_name):
-            if self._is_reserved_keyword(name):
-                raise ReservedNameError(
-                    f"'{root_name}' is a reserved name",
-                    reusable_name=False,
-                    reserved_name=root_name,
-                    platform=self.platform,
-                )
+        if not self._is_reserved_keyword(root_name) and (
+            base_name == root_name or not self._is_reserved_keyword(base_name)
+        ):
+            return VALID_RESULT
+
+        start = len(name) - len(base_name)
+        if base_name.startswith(root_name):
+            span = (start, start + len(root_name))
+        else:
+            span = (0, len(name))
+
+        return ValidationResult(
+            ErrorReason.RESERVED_NAME,
+            span=span,
+            error_factory=lambda: ReservedNameError(
+                f"'{root_name}' is a reserved name",
+                reusable_name=False,
+                reserved_name=root_name,
+                platform=self.platform,
+            ),
+        )
 
     def _validate_max_len(self) -> None:
         if self.max_len < 1:
@@ -0,0 +1,151 @@
+"""
+Batch sanitize and validate of many file paths with one sanitizer or
+validator, reporting per-path results instead of raising.
+
+Not part of upstream pathvalidate: added in the script.export_set fork,
+see __version__.py.
+"""
+
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from typing import NamedTuple, Optional
+
+from ._const import DEFAULT_MIN_LEN
+from ._filepath import _get_filepath_sanitizer, _get_filepath_validator
+from ._types import PathType, PlatformType
+from .error import ErrorReason, ValidationError
+from .handler import ValidationErrorHandler
+
+
+class SanitizeReport(NamedTuple):
+    """Result of :py:func:`.sanitize_filepaths`."""
+
+    #: Sanitized values in input order. |None| where sanitization failed.
+    results: list[Optional[PathType]]
+
+    #: Indices of the inputs whose sanitized value differs from the input.
+    changed: list[int]
+
+    #: Indices of the inputs that could not be sanitized.
+    failed: list[int]
+
+    #: Number of failures per error reason.
+    error_counts: dict[ErrorReason, int]
+
+
+class ValidationReport(NamedTuple):
+    """Result of :py:func:`.validate_filepaths`."""
+
+    #: Error reason per input in input order. |None| where the value is valid.
+    reasons: list[Optional[ErrorReason]]
+
+    #: Number of invalid values per error reason.
+    error_counts: dict[ErrorReason, int]
+
+    @property
+    def valid(self) -> list[bool]:
+        """list[bool]: Validity per input in input order."""
+        return [reason is None for reason in self.reasons]
+
+
+def sanitize_filepaths(
+    file_paths: Iterable[PathType],
+    replacement_text: str = "",
+    platform: Optional[PlatformType] = None,
+    max_len: Optional[int] = None,
+    fs_encoding: Optional[str] = None,
+    null_value_handler: Optional[ValidationErrorHandler] = None,
+    reserved_name_handler: Optional[ValidationErrorHandler] = None,
+    additional_reserved_names: Optional[Sequence[str]] = None,
+    normalize: bool = True,
+    validate_after_sanitize: bool = False,
+    cache_size: int = 0,
+) -> SanitizeReport:
+    """Make valid file paths from an iterable of strings in one call.
+
+    Every item is sanitized by a single sanitizer configured as
+    :py:func:`.sanitize_filepath` would be for the same arguments.
+    Validation errors do not stop the batch: the failing item is reported as |None|
+    and counted by :py:class:`~.error.ErrorReason`.
+
+    Args:
+        file_paths:
+            File paths to sanitize.
+
+    The remaining arguments are the same as :py:func:`.sanitize_filepath`.
+
+    Returns:
+        SanitizeReport: Sanitized values, changed/failed indices and error counts.
+    """
+
+    sanitizer = _get_filepath_sanitizer(
+        platform=platform,
+        max_len=-1 if max_len is None else max_len,
+        fs_encoding=fs_encoding,
+        normalize=normalize,
+        null_value_handler=null_value_handler,
+        reserved_name_handler=reserved_name_handler,
+        additional_reserved_names=additional_reserved_names,
+        validate_after_sanitize=validate_after_sanitize,
+        cache_size=cache_size,
+    )
+    results: list[Optional[PathType]] = []
+    changed: list[int] = []
+    failed: list[int] = []
+    error_counts: Counter[ErrorReason] = Counter()
+
+    for i, file_path in enumerate(file_paths):
+        try:
+            sanitized = sanitizer.sanitize(file_path, replacement_text)
+        except ValidationError as e:
+            results.append(None)
+            failed.append(i)
+            error_counts[e.reason] += 1
+            continue
+
+        results.append(sanitized)
+        if str(sanitized) != str(file_path):
+            changed.append(i)
+
+    return SanitizeReport(results, changed, failed, dict(error_counts))
+
+
+def validate_filepaths(
+    file_paths: Iterable[PathType],
+    platform: Optional[PlatformType] = None,
+    min_len: int = DEFAULT_MIN_LEN,
+    max_len: Optional[int] = None,
+    fs_encoding: Optional[str] = None,
+    check_reserved: bool = True,
+    additional_reserved_names: Optional[Sequence[str]] = None,
+) -> ValidationReport:
+    """Verifying an iterable of file paths in one call without raising per item.
+
+    Args:
+        file_paths:
+            File paths to validate.
+
+    The remaining arguments are the same as :py:func:`.validate_filepath`.
+
+    Returns:
+        ValidationReport: Error reason per item and error counts.
+    """
+
+    validator = _get_filepath_validator(
+        platform=platform,
+        min_len=min_len,
+        max_len=-1 if max_len is None else max_len,
+        fs_encoding=fs_encoding,
+        check_reserved=check_reserved,
+        additional_reserved_names=additional_reserved_names,
+    )
+    reasons: list[Optional[ErrorReason]] = []
+    error_counts: Counter[ErrorReason] = Counter()
+
+    for file_path in file_paths:
+        reason = validator.check(file_path).reason
+        reasons.append(reason)
+        if reason is not None:
+            error_counts[reason] += 1
+
+    return ValidationReport(reasons, dict(error_counts))
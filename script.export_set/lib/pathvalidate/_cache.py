@@ -0,0 +1,130 @@
+"""
+LRU cache of sanitizer and validator instances for the functional API.
+
+Not part of upstream pathvalidate: added in the script.export_set fork,
+see __version__.py.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Callable, Final, Generic, NamedTuple, Optional, TypeVar
+
+
+_T = TypeVar("_T")
+
+DEFAULT_INSTANCE_CACHE_SIZE: Final = 128
+
+
+class CacheInfo(NamedTuple):
+    """Cache statistics, laid out like :py:func:`functools.lru_cache` ``cache_info()``."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache(Generic[_T]):
+    """Thread-safe, size-bounded mapping with least-recently-used eviction.
+
+    Args:
+        maxsize:
+            Maximum number of entries to keep.
+            The least recently used entry is evicted when the bound is exceeded.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be greater than zero")
+
+        self.__maxsize = maxsize
+        self.__data: OrderedDict[Hashable, _T] = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self.__maxsize
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], _T]) -> _T:
+        """Return the value stored for ``key``, creating it with ``factory`` on a miss.
+
+        ``factory`` is called without holding the lock, so two threads missing the
+        same key at once may both build a value; the first one stored wins.
+        """
+
+        with self.__lock:
+            try:
+                value = self.__data[key]
+            except KeyError:
+                self.__misses += 1
+            else:
+                self.__data.move_to_end(key)
+                self.__hits += 1
+                return value
+
+        value = factory()
+
+        with self.__lock:
+            stored = self.__data.setdefault(key, value)
+            self.__data.move_to_end(key)
+            while len(self.__data) > self.__maxsize:
+                self.__data.popitem(last=False)
+
+        return stored
+
+    def cache_info(self) -> CacheInfo:
+        with self.__lock:
+            return CacheInfo(self.__hits, self.__misses, self.__maxsize, len(self.__data))
+
+    def cache_clear(self) -> None:
+        with self.__lock:
+            self.__data.clear()
+            self.__hits = 0
+            self.__misses = 0
+
+
+_instance_cache: Final[LRUCache[object]] = LRUCache(DEFAULT_INSTANCE_CACHE_SIZE)
+
+
+def get_cached_instance(key: tuple, factory: Callable[[], _T]) -> _T:
+    """Return a shared instance for a configuration ``key``.
+
+    Sanitizer and validator instances hold no per-call state once constructed, so an
+    instance built for one configuration can be reused by every caller with the same one.
+    Falls back to an uncached instance if the configuration is not hashable
+    (e.g. a handler that is an unhashable callable object).
+    """
+
+    try:
+        hash(key)
+    except TypeError:
+        return factory()
+
+    return _instance_cache.get_or_create(key, factory)  # type: ignore[return-value]
+
+
+def instance_cache_info() -> CacheInfo:
+    """Return hit/miss statistics of the instance cache used by the functional API
+    (:py:func:`~pathvalidate.sanitize_filepath` and friends).
+
+    Returns:
+        CacheInfo: Cache statistics.
+    """
+
+    return _instance_cache.cache_info()
+
+
+def clear_instance_cache() -> None:
+    """Drop every cached sanitizer/validator instance and reset the statistics."""
+
+    _instance_cache.cache_clear()
+
+
+def to_names_key(names: Optional[object]) -> Optional[tuple]:
+    if names is None:
+        return None
+
+    return tuple(names)  # type: ignore[call-overload]
@@ -22,14 +22,28 @@ def validate_pathtype(
 ) -> None:
     from .error import ErrorReason, ValidationError
 
+    if is_null_pathtype(text, allow_whitespaces):
+        raise ValidationError(reason=ErrorReason.NULL_NAME)
+
+
+def is_null_pathtype(text: PathType, allow_whitespaces: bool = False) -> bool:
+    """Non-raising counterpart of :py:func:`validate_pathtype`.
+
+    Returns:
+        bool: |True| if ``text`` is a null name.
+
+    Raises:
+        TypeError: If ``text`` is neither a string nor a path.
+    """
+
     if _is_not_null_string(text) or isinstance(text, PurePath):
-        return
+        return False
 
     if allow_whitespaces and _re_whitespaces.search(str(text)):
-        return
+        return False
 
     if is_null_string(text):
-        raise ValidationError(reason=ErrorReason.NULL_NAME)
+        return True
 
     raise TypeError(f"text must be a string: actual={type(text)}")
 
@@ -102,6 +116,50 @@ __RE_ANSI_ESCAPE: Final = re.compile(
 )
 
 
+class CharTranslator:
+    """Replace or delete a fixed set of characters in a single ``str.translate`` pass.
+
+    Produces the same output as ``re.sub("[<invalid_chars>]", replacement_text, text)``:
+    the per-character replacement is expanded once through the regular expression
+    (so escapes and template errors behave the same) and stored in a translation
+    table per ``replacement_text``.
+
+    Args:
+        invalid_chars:
+            Characters to replace.
+    """
+
+    __MAX_TABLES: Final = 32
+
+    def __init__(self, invalid_chars: str) -> None:
+        self.__invalid_chars = frozenset(invalid_chars)
+        self.__regexp = re.compile(f"[{re.escape(invalid_chars)}]", re.UNICODE)
+        self.__tables: dict[str, dict[int, str]] = {}
+
+    def translate(self, text: str, replacement_text: str = "") -> str:
+        table = self.__get_table(replacement_text)
+
+        if self.__invalid_chars.isdisjoint(text):
+            return text
+
+        return text.translate(table)
+
+    def __get_table(self, replacement_text: str) -> dict[int, str]:
+        try:
+            return self.__tables[replacement_text]
+        except KeyError:
+            pass
+
+        table = {
+            ord(c): self.__regexp.sub(replacement_text, c) for c in sorted(self.__invalid_chars)
+        }
+        if len(self.__tables) >= self.__MAX_TABLES:
+            self.__tables.clear()
+        self.__tables[replacement_text] = table
+
+        return table
+
+
 def validate_unprintable_char(text: str) -> None:
     from .error import InvalidCharError
 
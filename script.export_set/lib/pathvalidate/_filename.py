@@ -12,10 +12,26 @@ from re import Pattern
 from typing import Final, Optional
 
 from ._base import AbstractSanitizer, AbstractValidator, BaseFile, BaseValidator
-from ._common import findall_to_str, is_nt_abspath, to_str, truncate_str, validate_pathtype
+from ._cache import get_cached_instance, to_names_key
+from ._common import (
+    CharTranslator,
+    findall_to_str,
+    is_nt_abspath,
+    is_null_pathtype,
+    normalize_platform,
+    to_str,
+    truncate_str,
+)
 from ._const import DEFAULT_MIN_LEN, INVALID_CHAR_ERR_MSG_TMPL, Platform
 from ._types import PathType, PlatformType
-from .error import ErrorAttrKey, ErrorReason, InvalidCharError, ValidationError
+from .error import (
+    VALID_RESULT,
+    ErrorAttrKey,
+    ErrorReason,
+    InvalidCharError,
+    ValidationError,
+    ValidationResult,
+)
 from .handler import ReservedNameHandler, ValidationErrorHandler
 
 
@@ -26,6 +42,11 @@ _RE_INVALID_FILENAME: Final = re.compile(
 _RE_INVALID_WIN_FILENAME: Final = re.compile(
     f"[{re.escape(BaseFile._INVALID_WIN_FILENAME_CHARS):s}]", re.UNICODE
 )
+_NULL_NAME_RESULT: Final = ValidationResult(ErrorReason.NULL_NAME)
+_TRANSLATORS: Final = {
+    _RE_INVALID_FILENAME: CharTranslator(BaseFile._INVALID_FILENAME_CHARS),
+    _RE_INVALID_WIN_FILENAME: CharTranslator(BaseFile._INVALID_WIN_FILENAME_CHARS),
+}
 
 
 class FileNameSanitizer(AbstractSanitizer):
@@ -39,6 +60,7 @@ class FileNameSanitizer(AbstractSanitizer):
         additional_reserved_names: Optional[Sequence[str]] = None,
         validate_after_sanitize: bool = False,
         validator: Optional[AbstractValidator] = None,
+        cache_size: int = 0,
     ) -> None:
         if validator:
             fname_validator = validator
@@ -61,34 +83,39 @@ class FileNameSanitizer(AbstractSanitizer):
             platform=platform,
             validate_after_sanitize=validate_after_sanitize,
             validator=fname_validator,
+            cache_size=cache_size,
         )
 
         self._sanitize_regexp = self._get_sanitize_regexp()
+        self.__translator = _TRANSLATORS.get(self._sanitize_regexp)
 
     def sanitize(self, value: PathType, replacement_text: str = "") -> PathType:
-        try:
-            validate_pathtype(value, allow_whitespaces=not self._is_windows(include_universal=True))
-        except ValidationError as e:
-            if e.reason == ErrorReason.NULL_NAME:
-                if isinstance(value, PurePath):
-                    raise
+        return self._sanitize_with_cache(self.__sanitize, value, replacement_text)
 
-                return self._null_value_handler(e)  # type: ignore
-            raise
+    def __sanitize(self, value: PathType, replacement_text: str) -> PathType:
+        if is_null_pathtype(value, allow_whitespaces=not self._is_windows(include_universal=True)):
+            e = ValidationError(reason=ErrorReason.NULL_NAME)
+            if isinstance(value, PurePath):
+                raise e
 
-        sanitized_filename = self._sanitize_regexp.sub(replacement_text, str(value))
+            return self._null_value_handler(e)  # type: ignore
+
+        if self.__translator is not None:
+            sanitized_filename = self.__translator.translate(str(value), replacement_text)
+        else:
+            sanitized_filename = self._sanitize_regexp.sub(replacement_text, str(value))
         sanitized_filename = truncate_str(sanitized_filename, self._fs_encoding, self.max_len)
 
-        try:
-            self._validator.validate(sanitized_filename)
-        except ValidationError as e:
-            if e.reason == ErrorReason.RESERVED_NAME:
+        result = self._validator.check(sanitized_filename)
+        if not result:
+            if result.reason == ErrorReason.RESERVED_NAME:
+                e = result.error
                 replacement_word = self._reserved_name_handler(e)
                 if e.reserved_name != replacement_word:
                     sanitized_filename = re.sub(
                         re.escape(e.reserved_name), replacement_word, sanitized_filename
                     )
-            elif e.reason == ErrorReason.INVALID_CHARACTER and self._is_windows(
+            elif result.reason == ErrorReason.INVALID_CHARACTER and self._is_windows(
                 include_universal=True
             ):
                 # Do not start a file or directory name with a space
@@ -98,8 +125,8 @@ class FileNameSanitizer(AbstractSanitizer):
                 sanitized_filename = sanitized_filename.rstrip(" ")
                 if sanitized_filename not in (".", ".."):
                     sanitized_filename = sanitized_filename.rstrip(" .")
-            elif e.reason == ErrorReason.NULL_NAME:
-                sanitized_filename = self._null_value_handler(e)
+            elif result.reason == ErrorReason.NULL_NAME:
+                sanitized_filename = self._null_value_handler(result.error)
 
         if self._validate_after_sanitize:
             try:
@@ -137,9 +164,8 @@ class FileNameValidator(BaseValidator):
     )
     _MACOS_RESERVED_FILE_NAMES: Final = (":",)
 
-    @property
-    def reserved_keywords(self) -> tuple[str, ...]:
-        common_keywords = super().reserved_keywords
+    def _get_reserved_keywords(self) -> tuple[str, ...]:
+        common_keywords = super()._get_reserved_keywords()
 
         if self._is_universal():
             word_set = set(
@@ -175,12 +201,18 @@ class FileNameValidator(BaseValidator):
         )
 
     def validate(self, value: PathType) -> None:
-        validate_pathtype(value, allow_whitespaces=not self._is_windows(include_universal=True))
+        self.check(value).raise_for_error()
+
+    def check(self, value: PathType) -> ValidationResult:
+        if is_null_pathtype(value, allow_whitespaces=not self._is_windows(include_universal=True)):
+            return _NULL_NAME_RESULT
 
         unicode_filename = to_str(value)
         byte_ct = len(unicode_filename.encode(self._fs_encoding))
 
-        self.validate_abspath(unicode_filename)
+        result = self.check_abspath(unicode_filename)
+        if not result:
+            return result
 
         err_kwargs = {
             ErrorAttrKey.REASON: ErrorReason.INVALID_LENGTH,
@@ -190,64 +222,96 @@ class FileNameValidator(BaseValidator):
             ErrorAttrKey.VALUE: unicode_filename,
         }
         if byte_ct > self.max_len:
-            raise ValidationError(
-                [
-                    f"filename is too long: expected<={self.max_len:d} bytes, actual={byte_ct:d} bytes"
-                ],
-                **err_kwargs,
+            return ValidationResult(
+                ErrorReason.INVALID_LENGTH,
+                error_factory=lambda: ValidationError(
+                    [
+                        f"filename is too long: expected<={self.max_len:d} bytes, actual={byte_ct:d} bytes"
+                    ],
+                    **err_kwargs,
+                ),
             )
         if byte_ct < self.min_len:
-            raise ValidationError(
-                [
-                    f"filename is too short: expected>={self.min_len:d} bytes, actual={byte_ct:d} bytes"
-                ],
-                **err_kwargs,
+            return ValidationResult(
+                ErrorReason.INVALID_LENGTH,
+                error_factory=lambda: ValidationError(
+                    [
+                        f"filename is too short: expected>={self.min_len:d} bytes, actual={byte_ct:d} bytes"
+                    ],
+                    **err_kwargs,
+                ),
             )
 
-        self._validate_reserved_keywords(unicode_filename)
-        self.__validate_universal_filename(unicode_filename)
+        result = self._check_reserved_keywords(unicode_filename)
+        if not result:
+            return result
+
+        result = self.__check_universal_filename(unicode_filename)
+        if not result:
+            return result
 
         if self._is_windows(include_universal=True):
-            self.__validate_win_filename(unicode_filename)
+            return self.__check_win_filename(unicode_filename)
+
+        return VALID_RESULT
 
     def validate_abspath(self, value: str) -> None:
-        err = ValidationError(
-            description=f"found an absolute path ({value!r}), expected a filename",
-            platform=self.platform,
-            reason=ErrorReason.FOUND_ABS_PATH,
+        self.check_abspath(value).raise_for_error()
+
+    def check_abspath(self, value: str) -> ValidationResult:
+        result = ValidationResult(
+            ErrorReason.FOUND_ABS_PATH,
+            span=(0, len(value)),
+            error_factory=lambda: ValidationError(
+                description=f"found an absolute path ({value!r}), expected a filename",
+                platform=self.platform,
+                reason=ErrorReason.FOUND_ABS_PATH,
+            ),
         )
 
         if self._is_windows(include_universal=True):
             if is_nt_abspath(value):
-                raise err
+                return result
 
         if posixpath.isabs(value):
-            raise err
+            return result
+
+        return VALID_RESULT
 
-    def __validate_universal_filename(self, unicode_filename: str) -> None:
-        match = _RE_INVALID_FILENAME.findall(unicode_filename)
+    def __check_universal_filename(self, unicode_filename: str) -> ValidationResult:
+        match = _RE_INVALID_FILENAME.search(unicode_filename)
         if match:
-            raise InvalidCharError(
-                INVALID_CHAR_ERR_MSG_TMPL.format(
-                    invalid=findall_to_str(match),
+            return ValidationResult(
+                ErrorReason.INVALID_CHARACTER,
+                span=match.span(),
+                error_factory=lambda: InvalidCharError(
+                    INVALID_CHAR_ERR_MSG_TMPL.format(
+                        invalid=findall_to_str(_RE_INVALID_FILENAME.findall(unicode_filename)),
+                    ),
+                    platform=Platform.UNIVERSAL,
+                    value=unicode_filename,
                 ),
-                platform=Platform.UNIVERSAL,
-                value=unicode_filename,
             )
 
-    def __validate_win_filename(self, unicode_filename: str) -> None:
-        match = _RE_INVALID_WIN_FILENAME.findall(unicode_filename)
+        return VALID_RESULT
+
+    def __check_win_filename(self, unicode_filename: str) -> ValidationResult:
+        match = _RE_INVALID_WIN_FILENAME.search(unicode_filename)
         if match:
-            raise InvalidCharError(
-                INVALID_CHAR_ERR_MSG_TMPL.format(
-                    invalid=findall_to_str(match),
+            return ValidationResult(
+                ErrorReason.INVALID_CHARACTER,
+                span=match.span(),
+                error_factory=lambda: InvalidCharError(
+                    INVALID_CHAR_ERR_MSG_TMPL.format(
+                        invalid=findall_to_str(_RE_INVALID_WIN_FILENAME.findall(unicode_filename)),
+                    ),
+                    platform=Platform.WINDOWS,
+                    value=unicode_filename,
                 ),
-                platform=Platform.WINDOWS,
-                value=unicode_filename,
             )
 
         if unicode_filename in (".", ".."):
-            return
+            return VALID_RESULT
 
         KB2829981_err_tmpl = "{}. Refer: https://learn.microsoft.com/en-us/troubleshoot/windows-client/shell-experience/file-folder-name-whitespace-characters"  # noqa: E501
         err_kwargs = {
@@ -256,23 +320,97 @@ class FileNameValidator(BaseValidator):
         }
 
         if unicode_filename[-1] in (" ", "."):
-            raise InvalidCharError(
-                INVALID_CHAR_ERR_MSG_TMPL.format(invalid=re.escape(unicode_filename[-1])),
-                description=KB2829981_err_tmpl.format(
-                    "Do not end a file or directory name with a space or a period"
+            return ValidationResult(
+                ErrorReason.INVALID_CHARACTER,
+                span=(len(unicode_filename) - 1, len(unicode_filename)),
+                error_factory=lambda: InvalidCharError(
+                    INVALID_CHAR_ERR_MSG_TMPL.format(invalid=re.escape(unicode_filename[-1])),
+                    description=KB2829981_err_tmpl.format(
+                        "Do not end a file or directory name with a space or a period"
+                    ),
+                    **err_kwargs,
                 ),
-                **err_kwargs,
             )
 
         if unicode_filename[0] in (" "):
-            raise InvalidCharError(
-                INVALID_CHAR_ERR_MSG_TMPL.format(invalid=re.escape(unicode_filename[0])),
-                description=KB2829981_err_tmpl.format(
-                    "Do not start a file or directory name with a space"
+            return ValidationResult(
+                ErrorReason.INVALID_CHARACTER,
+                span=(0, 1),
+                error_factory=lambda: InvalidCharError(
+                    INVALID_CHAR_ERR_MSG_TMPL.format(invalid=re.escape(unicode_filename[0])),
+                    description=KB2829981_err_tmpl.format(
+                        "Do not start a file or directory name with a space"
+                    ),
+                    **err_kwargs,
                 ),
-                **err_kwargs,
             )
 
+        return VALID_RESULT
+
+
+def _get_filename_validator(
+    platform: Optional[PlatformType],
+    min_len: int,
+    max_len: int,
+    fs_encoding: Optional[str],
+    check_reserved: bool,
+    additional_reserved_names: Optional[Sequence[str]],
+) -> FileNameValidator:
+    return get_cached_instance(
+        (
+            FileNameValidator,
+            normalize_platform(platform),
+            min_len,
+            max_len,
+            fs_encoding,
+            check_reserved,
+            to_names_key(additional_reserved_names),
+        ),
+        lambda: FileNameValidator(
+            platform=platform,
+            min_len=min_len,
+            max_len=max_len,
+            fs_encoding=fs_encoding,
+            check_reserved=check_reserved,
+            additional_reserved_names=additional_reserved_names,
+        ),
+    )
+
+
+def _get_filename_sanitizer(
+    platform: Optional[PlatformType],
+    max_len: int,
+    fs_encoding: Optional[str],
+    null_value_handler: Optional[ValidationErrorHandler],
+    reserved_name_handler: Optional[ValidationErrorHandler],
+    additional_reserved_names: Optional[Sequence[str]],
+    validate_after_sanitize: bool,
+    cache_size: int,
+) -> FileNameSanitizer:
+    return get_cached_instance(
+        (
+            FileNameSanitizer,
+            normalize_platform(platform),
+            max_len,
+            fs_encoding,
+            null_value_handler,
+            reserved_name_handler,
+            to_names_key(additional_reserved_names),
+            validate_after_sanitize,
+            cache_size,
+        ),
+        lambda: FileNameSanitizer(
+            platform=platform,
+            max_len=max_len,
+            fs_encoding=fs_encoding,
+            null_value_handler=null_value_handler,
+            reserved_name_handler=reserved_name_handler,
+            additional_reserved_names=additional_reserved_names,
+            validate_after_sanitize=validate_after_sanitize,
+            cache_size=cache_size,
+        ),
+    )
+
 
 def validate_filename(
     filename: PathType,
@@ -334,7 +472,7 @@ def validate_filename(
         <https://docs.microsoft.com/en-us/windows/win32/fileio/naming-a-file>`__
     """
 
-    FileNameValidator(
+    _get_filename_validator(
         platform=platform,
         min_len=min_len,
         max_len=max_len,
@@ -368,7 +506,7 @@ def is_valid_filename(
         :py:func:`.validate_filename()`
     """
 
-    return FileNameValidator(
+    return _get_filename_validator(
         platform=platform,
         min_len=min_len,
         max_len=-1 if max_len is None else max_len,
@@ -389,6 +527,7 @@ def sanitize_filename(
     reserved_name_handler: Optional[ValidationErrorHandler] = None,
     additional_reserved_names: Optional[Sequence[str]] = None,
     validate_after_sanitize: bool = False,
+    cache_size: int = 0,
 ) -> PathType:
     """Make a valid filename from a string.
 
@@ -445,6 +584,11 @@ def sanitize_filename(
             Case insensitive.
         validate_after_sanitize:
             Execute validation after sanitization to the file name.
+        cache_size:
+            Maximum number of sanitization results to memoize for the configuration.
+            Repeated calls with the same ``filename`` and ``replacement_text`` return the
+            stored result. Only useful with deterministic handlers.
+            Defaults to ``0`` (no result caching).
 
     Returns:
         Same type as the ``filename`` (str or PathLike object):
@@ -467,7 +611,7 @@ def sanitize_filename(
         if check_reserved is False:
             reserved_name_handler = ReservedNameHandler.as_is
 
-    return FileNameSanitizer(
+    return _get_filename_sanitizer(
         platform=platform,
         max_len=-1 if max_len is None else max_len,
         fs_encoding=fs_encoding,
@@ -475,4 +619,5 @@ def sanitize_filename(
         reserved_name_handler=reserved_name_handler,
         additional_reserved_names=additional_reserved_names,
         validate_after_sanitize=validate_after_sanitize,
+        cache_size=cache_size,
     ).sanitize(filename, replacement_text)
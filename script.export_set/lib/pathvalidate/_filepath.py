@@ -13,11 +13,27 @@ from re import Pattern
 from typing import Final, Optional
 
 from ._base import AbstractSanitizer, AbstractValidator, BaseFile, BaseValidator
-from ._common import findall_to_str, is_nt_abspath, to_str, validate_pathtype
+from ._cache import get_cached_instance, to_names_key
+from ._common import (
+    CharTranslator,
+    findall_to_str,
+    is_nt_abspath,
+    is_null_pathtype,
+    normalize_platform,
+    to_str,
+)
 from ._const import _NTFS_RESERVED_FILE_NAMES, DEFAULT_MIN_LEN, INVALID_CHAR_ERR_MSG_TMPL, Platform
 from ._filename import FileNameSanitizer, FileNameValidator
 from ._types import PathType, PlatformType
-from .error import ErrorAttrKey, ErrorReason, InvalidCharError, ReservedNameError, ValidationError
+from .error import (
+    VALID_RESULT,
+    ErrorAttrKey,
+    ErrorReason,
+    InvalidCharError,
+    ReservedNameError,
+    ValidationError,
+    ValidationResult,
+)
 from .handler import ReservedNameHandler, ValidationErrorHandler
 
 
@@ -25,6 +41,22 @@ _RE_INVALID_PATH: Final = re.compile(f"[{re.escape(BaseFile._INVALID_PATH_CHARS)
 _RE_INVALID_WIN_PATH: Final = re.compile(
     f"[{re.escape(BaseFile._INVALID_WIN_PATH_CHARS):s}]", re.UNICODE
 )
+_NTFS_RESERVED_FILE_NAME_SET: Final = frozenset(_NTFS_RESERVED_FILE_NAMES)
+_NULL_NAME_RESULT: Final = ValidationResult(ErrorReason.NULL_NAME)
+_TRANSLATORS: Final = {
+    _RE_INVALID_PATH: CharTranslator(BaseFile._INVALID_PATH_CHARS),
+    _RE_INVALID_WIN_PATH: CharTranslator(BaseFile._INVALID_WIN_PATH_CHARS),
+}
+
+
+def _shift_result(result: ValidationResult, offset: int) -> ValidationResult:
+    if result.ok or result.span is None or offset == 0:
+        return result
+
+    start, end = result.span
+    return ValidationResult(
+        result.reason, span=(start + offset, end + offset), error_factory=lambda: result.error
+    )
 
 
 class FilePathSanitizer(AbstractSanitizer):
@@ -39,6 +71,7 @@ class FilePathSanitizer(AbstractSanitizer):
         normalize: bool = True,
         validate_after_sanitize: bool = False,
         validator: Optional[AbstractValidator] = None,
+        cache_size: int = 0,
     ) -> None:
         if validator:
             fpath_validator = validator
@@ -60,9 +93,11 @@ class FilePathSanitizer(AbstractSanitizer):
             additional_reserved_names=additional_reserved_names,
             platform=platform,
             validate_after_sanitize=validate_after_sanitize,
+            cache_size=cache_size,
         )
 
         self._sanitize_regexp = self._get_sanitize_regexp()
+        self.__translator = _TRANSLATORS.get(self._sanitize_regexp)
         self.__fname_sanitizer = FileNameSanitizer(
             max_len=self.max_len,
             fs_encoding=fs_encoding,
@@ -71,6 +106,7 @@ class FilePathSanitizer(AbstractSanitizer):
             additional_reserved_names=additional_reserved_names,
             platform=self.platform,
             validate_after_sanitize=validate_after_sanitize,
+            cache_size=cache_size,
         )
         self.__normalize = normalize
 
@@ -80,19 +116,22 @@ class FilePathSanitizer(AbstractSanitizer):
             self.__split_drive = posixpath.splitdrive
 
     def sanitize(self, value: PathType, replacement_text: str = "") -> PathType:
-        try:
-            validate_pathtype(value, allow_whitespaces=not self._is_windows(include_universal=True))
-        except ValidationError as e:
-            if e.reason == ErrorReason.NULL_NAME:
-                if isinstance(value, PurePath):
-                    raise
+        return self._sanitize_with_cache(self.__sanitize, value, replacement_text)
 
-                return self._null_value_handler(e)  # type: ignore
-            raise
+    def __sanitize(self, value: PathType, replacement_text: str) -> PathType:
+        if is_null_pathtype(value, allow_whitespaces=not self._is_windows(include_universal=True)):
+            e = ValidationError(reason=ErrorReason.NULL_NAME)
+            if isinstance(value, PurePath):
+                raise e
+
+            return self._null_value_handler(e)  # type: ignore
 
         unicode_filepath = to_str(value)
         drive, unicode_filepath = self.__split_drive(unicode_filepath)
-        unicode_filepath = self._sanitize_regexp.sub(replacement_text, unicode_filepath)
+        if self.__translator is not None:
+            unicode_filepath = self.__translator.translate(unicode_filepath, replacement_text)
+        else:
+            unicode_filepath = self._sanitize_regexp.sub(replacement_text, unicode_filepath)
         if self.__normalize and unicode_filepath:
             unicode_filepath = os.path.normpath(unicode_filepath)
         sanitized_path = unicode_filepath
@@ -101,7 +140,7 @@ class FilePathSanitizer(AbstractSanitizer):
         if drive:
             sanitized_entries.append(drive)
         for entry in sanitized_path.replace("\\", "/").split("/"):
-            if entry in _NTFS_RESERVED_FILE_NAMES:
+            if entry in _NTFS_RESERVED_FILE_NAME_SET:
                 sanitized_entries.append(f"{entry}_")
                 continue
 
@@ -116,11 +155,9 @@ class FilePathSanitizer(AbstractSanitizer):
             sanitized_entries.append(sanitized_entry)
 
         sanitized_path = self.__get_path_separator().join(sanitized_entries)
-        try:
-            self._validator.validate(sanitized_path)
-        except ValidationError as e:
-            if e.reason == ErrorReason.NULL_NAME:
-                sanitized_path = self._null_value_handler(e)
+        result = self._validator.check(sanitized_path)
+        if result.reason == ErrorReason.NULL_NAME:
+            sanitized_path = self._null_value_handler(result.error)
 
         if self._validate_after_sanitize:
             self._validator.validate(sanitized_path)
@@ -144,15 +181,22 @@ class FilePathSanitizer(AbstractSanitizer):
 
 
 class FilePathValidator(BaseValidator):
-    _RE_NTFS_RESERVED: Final = re.compile(
-        "|".join(f"^/{re.escape(pattern)}$" for pattern in _NTFS_RESERVED_FILE_NAMES),
-        re.IGNORECASE,
+    # case-insensitive like re.IGNORECASE: the few non-ASCII characters that
+    # re folds onto ASCII letters are mapped explicitly before lower()
+    _NTFS_RESERVED_FOLD_TABLE: Final = str.maketrans(
+        {
+            "\N{LATIN CAPITAL LETTER I WITH DOT ABOVE}": "i",
+            "\N{LATIN SMALL LETTER DOTLESS I}": "i",
+            "\N{LATIN SMALL LETTER LONG S}": "s",
+        }
+    )
+    _NTFS_RESERVED_PATHS: Final = frozenset(
+        f"/{name}".lower() for name in _NTFS_RESERVED_FILE_NAMES
     )
     _MACOS_RESERVED_FILE_PATHS: Final = ("/", ":")
 
-    @property
-    def reserved_keywords(self) -> tuple[str, ...]:
-        common_keywords = super().reserved_keywords
+    def _get_reserved_keywords(self) -> tuple[str, ...]:
+        common_keywords = super()._get_reserved_keywords()
 
         if any([self._is_universal(), self._is_posix(), self._is_macos()]):
             return common_keywords + self._MACOS_RESERVED_FILE_PATHS
@@ -195,12 +239,19 @@ class FilePathValidator(BaseValidator):
             self.__split_drive = posixpath.splitdrive
 
     def validate(self, value: PathType) -> None:
-        validate_pathtype(value, allow_whitespaces=not self._is_windows(include_universal=True))
-        self.validate_abspath(value)
+        self.check(value).raise_for_error()
 
-        _drive, tail = self.__split_drive(value)
+    def check(self, value: PathType) -> ValidationResult:
+        if is_null_pathtype(value, allow_whitespaces=not self._is_windows(include_universal=True)):
+            return _NULL_NAME_RESULT
+
+        result = self.check_abspath(value)
+        if not result:
+            return result
+
+        drive, tail = self.__split_drive(value)
         if not tail:
-            return
+            return VALID_RESULT
 
         unicode_filepath = to_str(tail)
         byte_ct = len(unicode_filepath.encode(self._fs_encoding))
@@ -213,95 +264,201 @@ class FilePathValidator(BaseValidator):
         }
 
         if byte_ct > self.max_len:
-            raise ValidationError(
-                [
-                    f"file path is too long: expected<={self.max_len:d} bytes, actual={byte_ct:d} bytes"
-                ],
-                **err_kwargs,
+            return ValidationResult(
+                ErrorReason.INVALID_LENGTH,
+                error_factory=lambda: ValidationError(
+                    [
+                        f"file path is too long: expected<={self.max_len:d} bytes, actual={byte_ct:d} bytes"
+                    ],
+                    **err_kwargs,
+                ),
             )
         if byte_ct < self.min_len:
-            raise ValidationError(
-                [
-                    "file path is too short: expected>={:d} bytes, actual={:d} bytes".format(
-                        self.min_len, byte_ct
-                    )
-                ],
-                **err_kwargs,
+            return ValidationResult(
+                ErrorReason.INVALID_LENGTH,
+                error_factory=lambda: ValidationError(
+                    [
+                        "file path is too short: expected>={:d} bytes, actual={:d} bytes".format(
+                            self.min_len, byte_ct
+                        )
+                    ],
+                    **err_kwargs,
+                ),
             )
 
-        self._validate_reserved_keywords(unicode_filepath)
+        # spans are reported relative to the whole value, drive included
+        offset = len(drive)
+
+        result = self._check_reserved_keywords(unicode_filepath)
+        if not result:
+            return _shift_result(result, offset)
+
         unicode_filepath = unicode_filepath.replace("\\", "/")
+        entry_offset = offset
         for entry in unicode_filepath.split("/"):
-            if not entry or entry in (".", ".."):
-                continue
+            if entry and entry not in (".", ".."):
+                result = self.__fname_validator.check(entry)
+                if not result:
+                    return _shift_result(result, entry_offset)
 
-            self.__fname_validator.validate(entry)
+            entry_offset += len(entry) + 1
 
         if self._is_windows(include_universal=True):
-            self.__validate_win_filepath(unicode_filepath)
+            result = self.__check_win_filepath(unicode_filepath)
         else:
-            self.__validate_unix_filepath(unicode_filepath)
+            result = self.__check_unix_filepath(unicode_filepath)
+
+        return _shift_result(result, offset)
 
     def validate_abspath(self, value: PathType) -> None:
+        self.check_abspath(value).raise_for_error()
+
+    def check_abspath(self, value: PathType) -> ValidationResult:
         is_posix_abs = posixpath.isabs(value)
         is_nt_abs = is_nt_abspath(to_str(value))
 
         if any([self._is_windows() and is_nt_abs, self._is_posix() and is_posix_abs]):
-            return
-
-        if self._is_universal() and any([is_nt_abs, is_posix_abs]):
-            ValidationError(
-                "platform-independent absolute file path is not supported",
+            return VALID_RESULT
+
+        err_result = ValidationResult(
+            ErrorReason.MALFORMED_ABS_PATH,
+            error_factory=lambda: ValidationError(
+                description=(
+                    f"an invalid absolute file path ({value!r}) for the platform ({self.platform.value})."
+                    + " to avoid the error, specify an appropriate platform corresponding to"
+                    + " the path format or 'auto'."
+                ),
                 platform=self.platform,
                 reason=ErrorReason.MALFORMED_ABS_PATH,
-            )
-
-        err_object = ValidationError(
-            description=(
-                f"an invalid absolute file path ({value!r}) for the platform ({self.platform.value})."
-                + " to avoid the error, specify an appropriate platform corresponding to"
-                + " the path format or 'auto'."
             ),
-            platform=self.platform,
-            reason=ErrorReason.MALFORMED_ABS_PATH,
         )
 
         if self._is_windows(include_universal=True) and is_posix_abs:
-            raise err_object
+            return err_result
 
         if not self._is_windows():
             drive, _tail = ntpath.splitdrive(value)
             if drive and is_nt_abs:
-                raise err_object
+                return err_result
 
-    def __validate_unix_filepath(self, unicode_filepath: str) -> None:
-        match = _RE_INVALID_PATH.findall(unicode_filepath)
+        return VALID_RESULT
+
+    def __check_unix_filepath(self, unicode_filepath: str) -> ValidationResult:
+        match = _RE_INVALID_PATH.search(unicode_filepath)
         if match:
-            raise InvalidCharError(
-                INVALID_CHAR_ERR_MSG_TMPL.format(invalid=findall_to_str(match)),
-                value=unicode_filepath,
+            return ValidationResult(
+                ErrorReason.INVALID_CHARACTER,
+                span=match.span(),
+                error_factory=lambda: InvalidCharError(
+                    INVALID_CHAR_ERR_MSG_TMPL.format(
+                        invalid=findall_to_str(_RE_INVALID_PATH.findall(unicode_filepath))
+                    ),
+                    value=unicode_filepath,
+                ),
             )
 
-    def __validate_win_filepath(self, unicode_filepath: str) -> None:
-        match = _RE_INVALID_WIN_PATH.findall(unicode_filepath)
+        return VALID_RESULT
+
+    def __check_win_filepath(self, unicode_filepath: str) -> ValidationResult:
+        match = _RE_INVALID_WIN_PATH.search(unicode_filepath)
         if match:
-            raise InvalidCharError(
-                INVALID_CHAR_ERR_MSG_TMPL.format(invalid=findall_to_str(match)),
-                platform=Platform.WINDOWS,
-                value=unicode_filepath,
+            return ValidationResult(
+                ErrorReason.INVALID_CHARACTER,
+                span=match.span(),
+                error_factory=lambda: InvalidCharError(
+                    INVALID_CHAR_ERR_MSG_TMPL.format(
+                        invalid=findall_to_str(_RE_INVALID_WIN_PATH.findall(unicode_filepath))
+                    ),
+                    platform=Platform.WINDOWS,
+                    value=unicode_filepath,
+                ),
             )
 
-        _drive, value = self.__split_drive(unicode_filepath)
-        if value:
-            match_reserved = self._RE_NTFS_RESERVED.search(value)
-            if match_reserved:
-                reserved_name = match_reserved.group()
-                raise ReservedNameError(
-                    f"'{reserved_name}' is a reserved name",
+        drive, value = self.__split_drive(unicode_filepath)
+        if value and self._is_ntfs_reserved_path(value):
+            return ValidationResult(
+                ErrorReason.RESERVED_NAME,
+                span=(len(drive), len(unicode_filepath)),
+                error_factory=lambda: ReservedNameError(
+                    f"'{value}' is a reserved name",
                     reusable_name=False,
-                    reserved_name=reserved_name,
+                    reserved_name=value,
                     platform=self.platform,
-                )
+                ),
+            )
+
+        return VALID_RESULT
+
+    @classmethod
+    def _is_ntfs_reserved_path(cls, value: str) -> bool:
+        return value.translate(cls._NTFS_RESERVED_FOLD_TABLE).lower() in cls._NTFS_RESERVED_PATHS
+
+
+def _get_filepath_validator(
+    platform: Optional[PlatformType],
+    min_len: int,
+    max_len: int,
+    fs_encoding: Optional[str],
+    check_reserved: bool,
+    additional_reserved_names: Optional[Sequence[str]],
+) -> FilePathValidator:
+    return get_cached_instance(
+        (
+            FilePathValidator,
+            normalize_platform(platform),
+            min_len,
+            max_len,
+            fs_encoding,
+            check_reserved,
+            to_names_key(additional_reserved_names),
+        ),
+        lambda: FilePathValidator(
+            platform=platform,
+            min_len=min_len,
+            max_len=max_len,
+            fs_encoding=fs_encoding,
+            check_reserved=check_reserved,
+            additional_reserved_names=additional_reserved_names,
+        ),
+    )
+
+
+def _get_filepath_sanitizer(
+    platform: Optional[PlatformType],
+    max_len: int,
+    fs_encoding: Optional[str],
+    normalize: bool,
+    null_value_handler: Optional[ValidationErrorHandler],
+    reserved_name_handler: Optional[ValidationErrorHandler],
+    additional_reserved_names: Optional[Sequence[str]],
+    validate_after_sanitize: bool,
+    cache_size: int,
+) -> FilePathSanitizer:
+    return get_cached_instance(
+        (
+            FilePathSanitizer,
+            normalize_platform(platform),
+            max_len,
+            fs_encoding,
+            normalize,
+            null_value_handler,
+            reserved_name_handler,
+            to_names_key(additional_reserved_names),
+            validate_after_sanitize,
+            cache_size,
+        ),
+        lambda: FilePathSanitizer(
+            platform=platform,
+            max_len=max_len,
+            fs_encoding=fs_encoding,
+            normalize=normalize,
+            null_value_handler=null_value_handler,
+            reserved_name_handler=reserved_name_handler,
+            additional_reserved_names=additional_reserved_names,
+            validate_after_sanitize=validate_after_sanitize,
+            cache_size=cache_size,
+        ),
+    )
 
 
 def validate_filepath(
@@ -361,7 +518,7 @@ def validate_filepath(
         <https://docs.microsoft.com/en-us/windows/win32/fileio/naming-a-file>`__
     """
 
-    FilePathValidator(
+    _get_filepath_validator(
         platform=platform,
         min_len=min_len,
         max_len=-1 if max_len is None else max_len,
@@ -395,7 +552,7 @@ def is_valid_filepath(
         :py:func:`.validate_filepath()`
     """
 
-    return FilePathValidator(
+    return _get_filepath_validator(
         platform=platform,
         min_len=min_len,
         max_len=-1 if max_len is None else max_len,
@@ -417,6 +574,7 @@ def sanitize_filepath(
     additional_reserved_names: Optional[Sequence[str]] = None,
     normalize: bool = True,
     validate_after_sanitize: bool = False,
+    cache_size: int = 0,
 ) -> PathType:
     """Make a valid file path from a string.
 
@@ -482,6 +640,12 @@ def sanitize_filepath(
             If |True|, normalize the the file path.
         validate_after_sanitize:
             Execute validation after sanitization to the file path.
+        cache_size:
+            Maximum number of sanitization results to memoize for the configuration.
+            Path components are memoized separately with the same bound, so paths
+            sharing directory prefixes reuse the per-component results.
+            Only useful with deterministic handlers.
+            Defaults to ``0`` (no result caching).
 
     Returns:
         Same type as the argument (str or PathLike object):
@@ -504,7 +668,7 @@ def sanitize_filepath(
         if check_reserved is False:
             reserved_name_handler = ReservedNameHandler.as_is
 
-    return FilePathSanitizer(
+    return _get_filepath_sanitizer(
         platform=platform,
         max_len=-1 if max_len is None else max_len,
         fs_encoding=fs_encoding,
@@ -513,4 +677,5 @@ def sanitize_filepath(
         reserved_name_handler=reserved_name_handler,
         additional_reserved_names=additional_reserved_names,
         validate_after_sanitize=validate_after_sanitize,
+        cache_size=cache_size,
     ).sanitize(file_path, replacement_text)
@@ -3,7 +3,7 @@
 """
 
 import enum
-from typing import Final, Optional
+from typing import Callable, Final, Optional
 
 from ._const import Platform
 
@@ -257,3 +257,79 @@ class InvalidReservedNameError(ReservedNameError):
         kwargs[ErrorAttrKey.REUSABLE_NAME] = False
 
         super().__init__(args, **kwargs)
+
+
+class ValidationResult:
+    """
+    Outcome of a non-raising validation
+    (:py:meth:`~pathvalidate.AbstractValidator.check`).
+
+    The corresponding :py:class:`ValidationError` is only constructed when
+    :py:attr:`error` is accessed or :py:meth:`raise_for_error` is called.
+    """
+
+    __slots__ = ("__reason", "__span", "__error_factory", "__error")
+
+    @property
+    def ok(self) -> bool:
+        """bool: |True| if the value is valid."""
+        return self.__reason is None
+
+    @property
+    def reason(self) -> Optional[ErrorReason]:
+        """
+        Optional[:py:class:`~pathvalidate.error.ErrorReason`]: The cause of the error.
+        |None| if the value is valid.
+        """
+        return self.__reason
+
+    @property
+    def span(self) -> Optional[tuple[int, int]]:
+        """Optional[Tuple[int, int]]: ``(start, end)`` indices of the offending part of the value,
+        if the error can be located."""
+        return self.__span
+
+    @property
+    def error(self) -> Optional[ValidationError]:
+        """Optional[ValidationError]: The error describing the problem. |None| if the value is valid."""
+        if self.__error is None and self.__reason is not None:
+            if self.__error_factory is None:
+                self.__error = ValidationError(reason=self.__reason)
+            else:
+                self.__error = self.__error_factory()
+
+        return self.__error
+
+    def __init__(
+        self,
+        reason: Optional[ErrorReason] = None,
+        span: Optional[tuple[int, int]] = None,
+        error_factory: Optional[Callable[[], ValidationError]] = None,
+    ) -> None:
+        self.__reason = reason
+        self.__span = span
+        self.__error_factory = error_factory
+        self.__error: Optional[ValidationError] = None
+
+    def __bool__(self) -> bool:
+        return self.ok
+
+    def __repr__(self) -> str:
+        if self.ok:
+            return "ValidationResult(ok=True)"
+
+        return f"ValidationResult(ok=False, reason={self.__reason!r}, span={self.__span!r})"
+
+    def raise_for_error(self) -> None:
+        """Raise the :py:attr:`error` if the value is invalid.
+
+        Raises:
+            ValidationError: If the value is invalid.
+        """
+
+        error = self.error
+        if error is not None:
+            raise error
+
+
+VALID_RESULT: Final = ValidationResult()
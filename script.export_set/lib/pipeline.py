@@ -0,0 +1,208 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+#    Copyright (C) 2025 Scott Smart
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+""" asyncio export pipeline.  A fetch stage pulls items from a blocking
+iterator on its own thread, processing stages run on the event loop, and
+a write stage runs tasks on a thread pool.  Stages are connected by
+bounded queues, so a slow stage holds back the ones before it and memory
+stays flat.  Queues carry the output of one input item as a batch, so the
+loop switches tasks per chunk rather than per set.  Every stage processes
+items in order and write results are delivered in submission order, so
+the output is the same as running the stages one after another.
+"""
+
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable
+
+_DONE = object()  # end of stream marker
+
+
+class StageMetrics:
+    """Throughput and input queue depth of one stage
+
+    Args:
+        name (str): stage name
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.items = 0
+        self.busy = 0.0  # seconds spent working, not waiting; for writes the span of the write stage
+        self.max_depth = 0
+        self._depth_total = 0
+        self._depth_samples = 0
+
+    def sample_depth(self, depth: int):
+        self.max_depth = max(self.max_depth, depth)
+        self._depth_total += depth
+        self._depth_samples += 1
+
+    @property
+    def mean_depth(self) -> float:
+        return self._depth_total / self._depth_samples if self._depth_samples else 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Items per busy second"""
+        return self.items / self.busy if self.busy > 0 else 0.0
+
+    def summary(self) -> str:
+        return (f'{self.name} {self.items} in {self.busy:.2f}s ({self.throughput:.0f}/s, '
+                f'queue max {self.max_depth} mean {self.mean_depth:.1f})')
+
+    def to_dict(self) -> dict:
+        return {'items': self.items, 'busy_seconds': round(self.busy, 4), 'throughput': round(self.throughput, 1),
+                'max_queue_depth': self.max_depth, 'mean_queue_depth': round(self.mean_depth, 2)}
+
+
+class Pipeline:
+    """fetch -> stages... -> write
+
+    Args:
+        stages (list[tuple[str, Callable]]): (name, func) processing stages.  func(item)
+            returns an iterable of items for the next stage.
+        workers (int): write threads
+        on_done (Callable): on_done(key, result) for each successful write
+        on_error (Callable): on_error(key, err) for each write that raised OSError
+        queue_size (int, optional): bound of each queue between stages. Defaults to 4.
+        max_pending (int, optional): writes in flight. Defaults to 8 per worker.
+    """
+
+    def __init__(self, stages: list, workers: int, on_done: Callable, on_error: Callable,
+                 queue_size: int = 4, max_pending: int = None):
+        self.stages = stages
+        self.workers = max(1, workers)
+        self.on_done = on_done
+        self.on_error = on_error
+        self.queue_size = queue_size
+        self.max_pending = max(1, max_pending or self.workers * 8)
+        self.metrics = [StageMetrics(name) for name in ['fetch', *(name for name, _func in stages), 'write']]
+        self.completed = 0
+        self.errors: list = []
+        self.elapsed = 0.0
+
+    def run(self, source: Iterable):
+        """Run the pipeline to completion
+
+        Args:
+            source (Iterable): blocking iterator of fetch stage items, e.g. pages of sets.
+                The write stage takes (key, task, args) items.
+        """
+        started = time.perf_counter()
+        try:
+            asyncio.run(self._run(iter(source)))
+        finally:
+            self.elapsed = time.perf_counter() - started
+
+    async def _run(self, source):
+        queues = [asyncio.Queue(self.queue_size) for _ in range(len(self.stages) + 1)]
+        with ThreadPoolExecutor(1, thread_name_prefix='export_fetch') as fetch_pool, \
+                ThreadPoolExecutor(self.workers, thread_name_prefix='export_set') as write_pool:
+            tasks = [asyncio.create_task(self._fetch(source, queues[0], fetch_pool))]
+            for index, (_name, func) in enumerate(self.stages):
+                tasks.append(asyncio.create_task(
+                    self._stage(func, queues[index], queues[index + 1], self.metrics[index + 1])))
+            tasks.append(asyncio.create_task(self._write(queues[-1], write_pool)))
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                raise
+
+    async def _fetch(self, source, output: asyncio.Queue, pool: ThreadPoolExecutor):
+        loop = asyncio.get_running_loop()
+        metrics = self.metrics[0]
+        while True:
+            started = time.perf_counter()
+            item = await loop.run_in_executor(pool, next, source, _DONE)
+            metrics.busy += time.perf_counter() - started
+            if item is _DONE:
+                break
+            metrics.items += 1
+            await output.put([item])
+        await output.put(_DONE)
+
+    @staticmethod
+    async def _stage(func: Callable, source: asyncio.Queue, output: asyncio.Queue, metrics: StageMetrics):
+        while True:
+            metrics.sample_depth(source.qsize())
+            batch = await source.get()
+            if batch is _DONE:
+                break
+            started = time.perf_counter()
+            results = [result for item in batch for result in func(item)]
+            metrics.busy += time.perf_counter() - started
+            metrics.items += len(batch)
+            if results:
+                await output.put(results)
+        await output.put(_DONE)
+
+    async def _write(self, source: asyncio.Queue, pool: ThreadPoolExecutor):
+        metrics = self.metrics[-1]
+        pending: deque = deque()
+        first = None
+        while True:
+            metrics.sample_depth(source.qsize())
+            batch = await source.get()
+            if batch is _DONE:
+                break
+            if first is None:
+                first = time.perf_counter()
+            for key, task, args in batch:
+                pending.append((key, pool.submit(task, *args)))
+                if len(pending) >= self.max_pending:
+                    await self._finished(pending[0][1])  # wake the loop only when the bound is hit
+                self._collect(pending)
+        while pending:
+            await self._finished(pending[0][1])
+            self._collect(pending)
+        if first is not None:
+            metrics.busy = time.perf_counter() - first
+
+    @staticmethod
+    async def _finished(future):
+        """Wait for a write without raising its error, which _collect delivers"""
+        waiter = asyncio.wrap_future(future)
+        await asyncio.wait([waiter])
+        waiter.exception()  # retrieved, so asyncio does not log it
+
+    def _collect(self, pending: deque):
+        """Deliver finished writes in submission order"""
+        while pending and pending[0][1].done():
+            key, future = pending.popleft()
+            try:
+                result = future.result()
+            except OSError as err:
+                self.errors.append((key, err))
+                self.on_error(key, err)
+            else:
+                self.completed += 1
+                self.on_done(key, result)
+            self.metrics[-1].items += 1
+
+    def summary(self) -> str:
+        """One line per-stage summary, valid after run()"""
+        total = self.completed + len(self.errors)
+        rate = total / self.elapsed if self.elapsed > 0 else 0.0
+        stages = ', '.join(metrics.summary() for metrics in self.metrics)
+        return (f'{total} sets in {self.elapsed:.2f}s ({rate:.1f} sets/s) pipelined with {self.workers} '
+                f'writer threads, {len(self.errors)} failed: {stages}')
@@ -0,0 +1,130 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+#    Copyright (C) 2025 Scott Smart
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+""" Orphaned set folders: MSIF folders that no library set sanitizes to,
+left behind when a set is renamed or removed.  When the export manifest
+is available, only folders it records the addon writing are removable;
+other set.nfo files may be hand-made.  On a file system that
+ignores case a folder differing from a set's folder only in case is the
+set's own folder, not an orphan.  Folders holding only a
+set.nfo can be removed, optionally after archiving the set.nfo files to a
+zip; folders holding anything else (artwork the user added) are reported
+but never touched.  A folder whose listing missed a file, such as a
+hidden one, keeps its set.nfo and is reported as kept when removed.
+"""
+
+import zipfile
+from pathlib import Path
+from typing import NamedTuple
+
+from lib.msif import NFO_NAME
+
+
+class Orphans(NamedTuple):
+    """Orphaned set folders
+
+    Attributes:
+        removable (list[str]): folders empty or holding only set.nfo
+        kept (list[str]): folders holding other files, left alone
+    """
+
+    removable: list
+    kept: list
+
+    def __len__(self) -> int:
+        return len(self.removable) + len(self.kept)
+
+
+def find_orphans(msif_index, library_folders: set, exported: set = None) -> Orphans:
+    """Compare the scanned MSIF with the folders the library sets export to,
+    ignoring case where the MSIF's file system does.  Only orphaned folders
+    are listed, one listing each.
+
+    Args:
+        msif_index (MsifIndex or VfsMsifIndex): the scanned MSIF
+        library_folders (set[str]): sanitized folder names of all library sets
+        exported (set[str], optional): folders the manifest records the addon writing.
+            Others are kept. Defaults to None (no manifest, any set.nfo-only folder is removable).
+
+    Returns:
+        Orphans: orphaned folders, sorted by name
+    """
+    removable, kept = [], []
+    fold = str if msif_index.case_sensitive() else str.casefold
+    live = {fold(folder) for folder in library_folders}
+    ours = None if exported is None else {fold(folder) for folder in exported}
+    for name in sorted(name for name in msif_index.folders() if fold(name) not in live):
+        if ours is not None and fold(name) not in ours:
+            kept.append(name)  # a set.nfo this addon did not write
+            continue
+        try:
+            entries = msif_index.folder_entries(name)
+        except OSError:
+            kept.append(name)  # cannot tell what it holds
+            continue
+        (removable if all(entry == NFO_NAME for entry in entries) else kept).append(name)
+    return Orphans(removable, kept)
+
+
+def archive_orphans(msif_index, names: list, archive: Path) -> int:
+    """Store the set.nfo of each folder in a zip, as folder/set.nfo
+
+    Args:
+        msif_index (MsifIndex or VfsMsifIndex): the MSIF
+        names (list[str]): orphaned folders
+        archive (Path): the zip file to create
+
+    Raises:
+        OSError: the zip could not be written
+
+    Returns:
+        int: number of set.nfo files archived
+    """
+    archive.parent.mkdir(parents=True, exist_ok=True)
+    archived = 0
+    with zipfile.ZipFile(archive, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+        for name in names:
+            try:
+                data = msif_index.read_nfo(name)
+            except OSError:
+                continue  # an empty folder has nothing to keep
+            zf.writestr(f'{name}/{NFO_NAME}', data)
+            archived += 1
+    return archived
+
+
+def remove_orphans(msif_index, names: list) -> tuple[list, list, list]:
+    """Delete orphaned folders and their set.nfo
+
+    Args:
+        msif_index (MsifIndex or VfsMsifIndex): the MSIF
+        names (list[str]): orphaned folders from Orphans.removable
+
+    Returns:
+        tuple[list, list, list]: removed folder names, folders found not to be empty and
+            left with their set.nfo, and (name, OSError) for failures
+    """
+    removed, kept, failed = [], [], []
+    for name in names:
+        try:
+            gone = msif_index.remove_folder(name)
+        except OSError as err:
+            failed.append((name, err))
+        else:
+            (removed if gone else kept).append(name)
+    return removed, kept, failed
@@ -0,0 +1,226 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+#    Copyright (C) 2025 Scott Smart
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+""" Set title sanitizing and set.nfo rendering, the CPU work of an export.
+Nothing here imports Kodi modules, so chunks of sets can be prepared in
+worker processes: prepare_chunks() hands chunks to a process pool and
+yields the prepared chunks in order, holding only a few in flight.
+"""
+
+import multiprocessing
+import re
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional
+from urllib.parse import unquote
+
+from lib.manifest import content_digest
+from lib.nfo import NfoTemplate, element
+from lib.pathvalidate import SanitizeReport, sanitize_filepaths
+
+ELEMENTS = ['title', 'overview', 'originaltitle'] #set/collection info to add to set.nfo
+SET_NFO = NfoTemplate('set', ELEMENTS)
+ART_TYPE = re.compile(r'[A-Za-z][\w-]*$')  # art types usable as element names
+
+
+class RenderConfig(NamedTuple):
+    """Picklable settings of the sanitize step
+
+    Attributes:
+        platform (str): pathvalidate platform folder names are sanitized for,
+            "universal" for network MSIFs
+        replacement_text (str): replaces invalid characters
+    """
+
+    platform: str = 'auto'
+    replacement_text: str = '_'
+
+
+class PreparedChunk(NamedTuple):
+    """A chunk of sets sanitized and rendered
+
+    Attributes:
+        report (SanitizeReport): folder name of each set, None where it failed
+        documents (list): (set.nfo bytes, digest) of each set, None where the title failed
+        sanitize_seconds (float): time spent sanitizing
+        render_seconds (float): time spent rendering
+    """
+
+    report: SanitizeReport
+    documents: list
+    sanitize_seconds: float
+    render_seconds: float
+
+
+def render_set_nfo(row: list) -> bytes:
+    """Build the set.nfo document for one set
+
+    Args:
+        row (list): movie set info row [setid, ELEMENTS..., extras].  The optional
+            extras dict holds the set's 'art' and member 'movies'.
+
+    Returns:
+        bytes: utf-8 encoded set.nfo
+    """
+    extras = row[len(ELEMENTS) + 1] if len(row) > len(ELEMENTS) + 1 else None
+    return SET_NFO.render(row[1:len(ELEMENTS) + 1], set_children(extras) if extras else None)
+
+
+def art_url(image: str) -> str:
+    """The original url or path of a Kodi image:// art value"""
+    if image.startswith('image://'):
+        return unquote(image[len('image://'):].rstrip('/'))
+    return image
+
+
+def set_children(extras: dict) -> list[str]:
+    """<art> and <movie> elements for a set
+
+    Args:
+        extras (dict): the set's 'art' (type -> Kodi image) and 'movies' (movie details)
+
+    Returns:
+        list[str]: elements for NfoTemplate.render
+    """
+    children = []
+    art = [(kind, url) for kind, url in sorted(extras.get('art', {}).items()) if ART_TYPE.match(kind) and url]
+    if art:
+        children.append(element('art', children=[element(kind, art_url(url), level=2) for kind, url in art]))
+    for movie in extras.get('movies', ()):
+        movie_elements = [element('title', movie.get('title') or movie.get('label', ''), level=2)]
+        if movie.get('year'):
+            movie_elements.append(element('year', movie['year'], level=2))
+        for kind, value in sorted((movie.get('uniqueid') or {}).items()):
+            movie_elements.append(element('uniqueid', value, {'type': kind}, level=2))
+        children.append(element('movie', children=movie_elements))
+    return children
+
+
+def sanitize_titles(titles: list[str], config: RenderConfig) -> SanitizeReport:
+    """Sanitize set titles into MSIF folder names
+
+    Args:
+        titles (list[str]): set titles
+        config (RenderConfig): sanitize settings
+
+    Returns:
+        SanitizeReport: folder name Path for each title, None where it failed
+    """
+    # a title is one folder name, so neither separator may split it
+    return sanitize_filepaths([Path(title.replace('/', '_').replace('\\', '_')) for title in titles],
+                              replacement_text=config.replacement_text, platform=config.platform,
+                              normalize=False)
+
+
+def sanitize_chunk(config: RenderConfig, rows: list) -> PreparedChunk:
+    """Sanitize the titles of a chunk of rows, see render_chunk"""
+    started = time.perf_counter()
+    report = sanitize_titles([row[1] for row in rows], config)
+    return PreparedChunk(report, [], time.perf_counter() - started, 0.0)
+
+
+def render_chunk(rows: list, sanitized: PreparedChunk) -> PreparedChunk:
+    """Render the set.nfo of each row whose title sanitized
+
+    Args:
+        rows (list): movie set info rows, see render_set_nfo
+        sanitized (PreparedChunk): the rows' sanitize_chunk result
+
+    Returns:
+        PreparedChunk: with documents
+    """
+    started = time.perf_counter()
+    documents = []
+    for row, folder in zip(rows, sanitized.report.results):
+        if folder is None:
+            documents.append(None)
+            continue
+        nfo_data = render_set_nfo(row)
+        documents.append((nfo_data, content_digest(nfo_data)))
+    return sanitized._replace(documents=documents, render_seconds=time.perf_counter() - started)
+
+
+def prepare_chunk(config: RenderConfig, rows: list) -> PreparedChunk:
+    """Sanitize and render a chunk of rows.  The work unit of a render process."""
+    return render_chunk(rows, sanitize_chunk(config, rows))
+
+
+def process_context() -> Optional[multiprocessing.context.BaseContext]:
+    """The fork start method, None where the platform lacks it.  Inside Kodi
+    the interpreter is the Kodi binary, so spawned workers cannot be used.
+    Forking the multi-threaded Kodi process can deadlock a worker on a lock
+    another thread held at the fork.
+    """
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        return None
+    return multiprocessing.get_context('fork')
+
+
+def _next_prepared(pending: deque) -> tuple[list, PreparedChunk]:
+    """Wait for the oldest chunk in flight, leaving it queued if it fails"""
+    rows, future = pending[0]
+    prepared = future.result()
+    pending.popleft()
+    return rows, prepared
+
+
+def prepare_chunks(chunks: Iterable[list], config: RenderConfig, processes: int = 1,
+                   on_fallback: Callable = None) -> Iterator[tuple[list, PreparedChunk]]:
+    """Prepare chunks of rows, in worker processes if processes > 1.  Chunks
+    are yielded in input order; at most two per process are in flight.  If
+    the pool cannot be used or breaks, or fork() fails, the remaining
+    chunks are prepared in this process.
+
+    Args:
+        chunks (Iterable[list]): chunks of movie set info rows
+        config (RenderConfig): sanitize settings
+        processes (int, optional): worker processes. Defaults to 1 (no pool).
+        on_fallback (Callable, optional): on_fallback(err) when the pool is given up
+
+    Yields:
+        tuple[list, PreparedChunk]: each chunk with its result
+    """
+    chunks = iter(chunks)
+    context = process_context() if processes > 1 else None
+    if processes > 1 and context is None and on_fallback is not None:
+        on_fallback(NotImplementedError('no fork start method'))
+    if context is not None:
+        pending: deque = deque()
+        rows = None  # a chunk taken from chunks but not yet submitted
+        try:
+            with ProcessPoolExecutor(processes, mp_context=context) as pool:
+                for rows in chunks:
+                    pending.append((rows, pool.submit(prepare_chunk, config, rows)))
+                    rows = None
+                    if len(pending) >= processes * 2:
+                        yield _next_prepared(pending)
+                while pending:
+                    yield _next_prepared(pending)
+        except (OSError, RuntimeError) as err:
+            # BrokenProcessPool is a RuntimeError, as is os.fork() refusing to run in a
+            # subinterpreter (Python 3.8 to 3.11), which is how Kodi runs addons
+            if on_fallback is not None:
+                on_fallback(err)
+            for queued, _future in pending:
+                yield queued, prepare_chunk(config, queued)
+            if rows is not None:
+                yield rows, prepare_chunk(config, rows)
+    for rows in chunks:
+        yield rows, prepare_chunk(config, rows)
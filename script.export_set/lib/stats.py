@@ -0,0 +1,158 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+#    Copyright (C) 2025 Scott Smart
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+""" Per-phase timing and counters for one export run, logged as a summary
+line and saved as a JSON report in the addon profile folder.  Phases timed
+on writer threads add up the time of every thread, so their total can
+exceed the wall time of the run.
+"""
+
+import heapq
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+REPORT_VERSION = 1
+REPORT_FILENAME = 'export_report.json'
+
+SETTINGS = 'settings'
+RETRIEVE = 'retrieve'
+SANITIZE = 'sanitize'
+RENDER = 'render'
+STAT = 'stat'
+MKDIR = 'mkdir'
+COMPARE = 'compare'
+WRITE = 'write'
+PHASES = (SETTINGS, RETRIEVE, SANITIZE, RENDER, STAT, MKDIR, COMPARE, WRITE)
+
+
+class ExportStats:
+    """Wall time and call count per phase, plus named counters
+
+    Args:
+        slowest (int, optional): number of slowest writes to keep. Defaults to 10.
+    """
+
+    def __init__(self, slowest: int = 10):
+        self.started = time.perf_counter()
+        self.started_at = datetime.now(timezone.utc)
+        self.phases: dict[str, list] = {phase: [0.0, 0] for phase in PHASES}  # phase -> [seconds, count]
+        self.counters: dict[str, int] = {}
+        self.info: dict[str, object] = {}
+        self._slowest = slowest
+        self._writes: list[tuple[float, str]] = []  # min-heap of (seconds, file)
+        self._lock = threading.Lock()  # writer threads record stat/mkdir/write phases
+
+    def add(self, phase: str, seconds: float, count: int = 1):
+        """Add time spent in a phase
+
+        Args:
+            phase (str): phase name, usually one of PHASES
+            seconds (float): elapsed time
+            count (int, optional): operations done in that time. Defaults to 1.
+        """
+        with self._lock:
+            entry = self.phases.setdefault(phase, [0.0, 0])
+            entry[0] += seconds
+            entry[1] += count
+
+    @contextmanager
+    def timed(self, phase: str, count: int = 1):
+        """Time the block as one or more operations of phase
+
+        Args:
+            phase (str): phase name
+            count (int, optional): operations done in the block. Defaults to 1.
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(phase, time.perf_counter() - started, count)
+
+    def record_write(self, location: str, seconds: float):
+        """Time one set.nfo write, keeping the slowest
+
+        Args:
+            location (str): the written file
+            seconds (float): elapsed time
+        """
+        with self._lock:
+            entry = self.phases[WRITE]
+            entry[0] += seconds
+            entry[1] += 1
+            if len(self._writes) < self._slowest:
+                heapq.heappush(self._writes, (seconds, location))
+            elif seconds > self._writes[0][0]:
+                heapq.heapreplace(self._writes, (seconds, location))
+
+    def count(self, name: str, value: int = 1):
+        """Add to a named counter, e.g. a write outcome"""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def slowest_writes(self) -> list[tuple[str, float]]:
+        """(file, seconds) of the slowest writes, slowest first"""
+        return [(location, seconds) for seconds, location in sorted(self._writes, reverse=True)]
+
+    def elapsed(self) -> float:
+        """Seconds since the run started"""
+        return time.perf_counter() - self.started
+
+    def summary(self) -> str:
+        """One line summary of the phases that ran
+
+        Returns:
+            str: e.g. 'total 2.51s: settings 0.001s/1, retrieve 0.210s/3, ...'
+        """
+        phases = ', '.join(f'{phase} {seconds:.3f}s/{count}'
+                           for phase, (seconds, count) in self.phases.items() if count)
+        return f'total {self.elapsed():.2f}s: {phases or "nothing done"}'
+
+    def to_dict(self) -> dict:
+        """The report as json-able data"""
+        return {
+            'version': REPORT_VERSION,
+            'started': self.started_at.isoformat(timespec='seconds'),
+            'total_seconds': round(self.elapsed(), 4),
+            'phases': {phase: {'seconds': round(seconds, 4), 'count': count}
+                       for phase, (seconds, count) in self.phases.items()},
+            'counters': dict(self.counters),
+            'slowest_writes': [{'file': location, 'seconds': round(seconds, 4)}
+                               for location, seconds in self.slowest_writes()],
+            **self.info,
+        }
+
+    def save(self, path: Path):
+        """Write the report, replacing the previous run's
+
+        Args:
+            path (Path): the report json file
+
+        Raises:
+            OSError: the report could not be written
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, path)
@@ -0,0 +1,346 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+#    Copyright (C) 2025 Scott Smart
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+""" MSIF index for network (smb://, nfs://) MSIFs.  Folders and set.nfo
+files are created through Kodi's VFS (xbmcvfs), which handles the share
+connections.  The VFS module is passed in so the index can be exercised
+outside Kodi against the benchmark's xbmcvfs stand-in.
+"""
+
+import threading
+from typing import Optional
+from urllib.parse import urlsplit, urlunsplit
+
+from lib.msif import NFO_NAME, REMOVING_NAME
+
+NETWORK_SCHEMES = ('smb', 'nfs')
+
+
+def redact_url(url: str) -> str:
+    """The url without any user:password@ part, for logs and saved files
+
+    Args:
+        url (str): an MSIF url or path.  Paths are returned unchanged.
+    """
+    parts = urlsplit(url)
+    if '@' not in parts.netloc:
+        return url
+    return urlunsplit(parts._replace(netloc=parts.netloc.rpartition('@')[2]))
+
+
+class VfsMsifIndex:
+    """Set folders present in a network MSIF.  Same interface as
+    lib.msif.MsifIndex.
+
+    Args:
+        root_url (str): the MSIF url
+        folders (set[str], optional): names of the existing set folders
+        vfs (module, optional): xbmcvfs or a stand-in. Defaults to xbmcvfs.
+    """
+
+    def __init__(self, root_url: str, folders: set = None, vfs=None):
+        if vfs is None:
+            import xbmcvfs as vfs  # pylint: disable=import-outside-toplevel
+        self.vfs = vfs
+        self.root_url = root_url if root_url.endswith('/') else root_url + '/'
+        self.location = redact_url(self.root_url)  # for messages; root_url may hold credentials
+        self._folders: set[str] = set() if folders is None else folders
+        self._lock = threading.Lock()  # writer threads share the index
+        self.scandir_calls = 0
+        self.stat_calls = 0
+        self.mkdir_calls = 0
+
+    @classmethod
+    def scan(cls, root_url: str, vfs=None) -> 'VfsMsifIndex':
+        """List the MSIF once.  Folders missing from the listing are created
+        with mkdirs.  xbmcvfs.listdir gives an empty listing rather than an
+        error for a share it cannot reach, so the MSIF must exist.
+
+        Args:
+            root_url (str): the MSIF url
+            vfs (module, optional): xbmcvfs or a stand-in. Defaults to xbmcvfs.
+
+        Raises:
+            OSError: the MSIF does not exist or the share could not be reached
+
+        Returns:
+            VfsMsifIndex: the index
+        """
+        index = cls(root_url, vfs=vfs)
+        if not index.vfs.exists(index.root_url):
+            raise OSError(f'could not read {index.location}')
+        dirs, _files = index.vfs.listdir(index.root_url)
+        index._folders = {name.rstrip('/') for name in dirs}
+        index.scandir_calls = 1
+        return index
+
+    def __len__(self) -> int:
+        return len(self._folders)
+
+    def folders(self) -> set:
+        """Names of all set folders in the MSIF"""
+        return set(self._folders)
+
+    def case_sensitive(self) -> bool:
+        """True if the share tells names apart by case.  Probed by looking the
+        MSIF up with the case of its name swapped.  A name without letters
+        cannot be probed and is taken as case-insensitive.
+        """
+        parent, _sep, name = self.root_url.rstrip('/').rpartition('/')
+        if name.swapcase() == name:
+            return False
+        return not self.vfs.exists(f'{parent}/{name.swapcase()}/')
+
+    def has_folder(self, name: str) -> bool:
+        """True if the MSIF held the set folder when scanned, or it was created since
+
+        Args:
+            name (str): sanitized set folder name
+        """
+        return name in self._folders
+
+    def nfo_size(self, name: str) -> Optional[int]:
+        """Size of the folder's set.nfo.  No VFS call for a folder that does not exist.
+
+        Args:
+            name (str): sanitized set folder name
+
+        Returns:
+            Optional[int]: size in bytes, None if there is no set.nfo
+        """
+        if name not in self._folders:
+            return None
+        with self._lock:
+            self.stat_calls += 1
+        url = self._nfo_url(name)
+        if not self.vfs.exists(url):
+            return None
+        return self.vfs.Stat(url).st_size()
+
+    def ensure_folder(self, name: str) -> str:
+        """Create the set folder unless the index knows it exists
+
+        Args:
+            name (str): sanitized set folder name
+
+        Raises:
+            OSError: the folder could not be created
+
+        Returns:
+            str: the set folder url
+        """
+        url = f'{self.root_url}{name}/'
+        if name not in self._folders:
+            if not self.vfs.mkdirs(url):
+                raise OSError(f'could not create folder {self.location}{name}/')
+            with self._lock:
+                self.mkdir_calls += 1
+                self._folders.add(name)
+        return url
+
+    def read_nfo(self, name: str) -> bytes:
+        """Content of the folder's set.nfo
+
+        Args:
+            name (str): sanitized set folder name
+        """
+        with self.vfs.File(self._nfo_url(name)) as f:
+            return bytes(f.readBytes())
+
+    def write_nfo(self, name: str, data: bytes):
+        """Replace the folder's set.nfo
+
+        Args:
+            name (str): sanitized set folder name
+            data (bytes): the set.nfo content
+
+        Raises:
+            OSError: the file could not be written
+        """
+        with self.vfs.File(self._nfo_url(name), 'w') as f:
+            if not f.write(bytearray(data)):
+                raise OSError(f'could not write {self.nfo_location(name)}')
+
+    def create_nfo(self, name: str, data: bytes) -> bool:
+        """Write the folder's set.nfo unless it exists.  xbmcvfs has no
+        exclusive create, so this is an exists check and a write.  The check
+        is made even for a folder this index just created: mkdirs also
+        succeeds for a folder the scan missed, such as one differing in case
+        on a share that ignores it.  The folder is assumed to exist; it is
+        only created when the write fails.
+
+        Args:
+            name (str): sanitized set folder name
+            data (bytes): the set.nfo content
+
+        Raises:
+            OSError: the folder or file could not be created or written
+
+        Returns:
+            bool: True if written, False if the folder already had a set.nfo
+        """
+        if self.vfs.exists(self._nfo_url(name)):
+            return False
+        try:
+            self.write_nfo(name, data)
+        except OSError:  # the folder may have been removed since the scan
+            with self._lock:
+                self._folders.discard(name)
+            self.ensure_folder(name)
+            self.write_nfo(name, data)
+        return True
+
+    def nfo_location(self, name: str) -> str:
+        """The folder's set.nfo url for log messages, without credentials
+
+        Args:
+            name (str): sanitized set folder name
+        """
+        return f'{self.location}{name}/{NFO_NAME}'
+
+    def _nfo_url(self, name: str) -> str:
+        return f'{self.root_url}{name}/{NFO_NAME}'
+
+    def folder_entries(self, name: str) -> list[str]:
+        """Names in a set folder, subfolders with a trailing '/'
+
+        Args:
+            name (str): set folder name
+        """
+        dirs, files = self.vfs.listdir(f'{self.root_url}{name}/')
+        return [d.rstrip('/') + '/' for d in dirs] + list(files)
+
+    def remove_folder(self, name: str) -> bool:
+        """Remove a set folder holding only its set.nfo.  The set.nfo is
+        moved aside first and put back if the folder cannot be removed.
+        xbmcvfs.listdir leaves out hidden files unless Kodi shows them, so a
+        folder listed as holding only set.nfo may hold more.
+
+        Args:
+            name (str): set folder name
+
+        Raises:
+            OSError: the set.nfo could not be moved aside or put back
+
+        Returns:
+            bool: True if removed, False if the folder could not be removed and was left as it was
+        """
+        url = self._nfo_url(name)
+        aside = self._file_url(REMOVING_NAME)
+        moved = self.vfs.exists(url)
+        if moved and not self.vfs.rename(url, aside):
+            raise OSError(f'could not move {self.nfo_location(name)}')
+        if not self.vfs.rmdir(f'{self.root_url}{name}/'):
+            if moved and not self.vfs.rename(aside, url):
+                raise OSError(f'could not put back {self.nfo_location(name)}, '
+                              f'it is {self.file_location(REMOVING_NAME)}')
+            return False
+        if moved:
+            self.vfs.delete(aside)
+        with self._lock:
+            self._folders.discard(name)
+        return True
+
+    def open_write(self, name: str) -> '_VfsWriter':
+        """Open a file in the MSIF for writing, creating the MSIF if needed
+
+        Args:
+            name (str): file name
+
+        Raises:
+            OSError: the file could not be created
+
+        Returns:
+            _VfsWriter: write-only binary file object
+        """
+        if not self.vfs.mkdirs(self.root_url):
+            raise OSError(f'could not create folder {self.location}')
+        return _VfsWriter(self.vfs.File(self._file_url(name), 'w'), self.file_location(name))
+
+    def replace_file(self, source: str, target: str):
+        """Rename a file in the MSIF over another.  xbmcvfs.rename does not
+        replace an existing file, so target is first renamed to a backup,
+        which is restored if the rename fails and deleted once it succeeded.
+        The MSIF never lacks a complete target.
+
+        Args:
+            source (str): file name
+            target (str): file name, replaced if it exists
+
+        Raises:
+            OSError: the file could not be renamed
+        """
+        backup = f'{target}.old'
+        replacing = self.vfs.exists(self._file_url(target))
+        if replacing:
+            self.remove_file(backup)
+            if not self.vfs.rename(self._file_url(target), self._file_url(backup)):
+                raise OSError(f'could not rename {self.file_location(target)}')
+        if not self.vfs.rename(self._file_url(source), self._file_url(target)):
+            if replacing:
+                self.vfs.rename(self._file_url(backup), self._file_url(target))
+            raise OSError(f'could not rename {self.file_location(source)}')
+        if replacing:
+            self.vfs.delete(self._file_url(backup))  # a leftover backup is replaced next time
+
+    def remove_file(self, name: str):
+        """Delete a file in the MSIF if it exists
+
+        Args:
+            name (str): file name
+
+        Raises:
+            OSError: the file could not be removed
+        """
+        url = self._file_url(name)
+        if self.vfs.exists(url) and not self.vfs.delete(url):
+            raise OSError(f'could not delete {self.file_location(name)}')
+
+    def file_location(self, name: str) -> str:
+        """A file url in the MSIF for log messages, without credentials"""
+        return f'{self.location}{name}'
+
+    def _file_url(self, name: str) -> str:
+        return f'{self.root_url}{name}'
+
+
+class _VfsWriter:
+    """Write-only binary file object over an xbmcvfs.File, for zipfile and
+    tarfile streams.  It cannot seek or tell.
+    """
+
+    def __init__(self, vfs_file, url: str):
+        self._file = vfs_file
+        self._url = url
+
+    def __enter__(self) -> '_VfsWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def write(self, data: bytes) -> int:
+        if data and not self._file.write(bytearray(data)):
+            raise OSError(f'could not write {self._url}')
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self._file.close()
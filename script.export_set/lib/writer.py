@@ -0,0 +1,194 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+#    Copyright (C) 2025 Scott Smart
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+""" set.nfo file writing helpers.
+"""
+
+import time
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+from lib.stats import COMPARE, MKDIR, STAT, ExportStats
+
+CREATED = 'created'
+UPDATED = 'updated'
+UNCHANGED = 'unchanged'
+KEPT = 'kept'  # existing file left alone because overwrite was declined
+
+
+def _ensure_folder(msif_index, folder: str, stats: ExportStats = None):
+    """Create the set folder unless the index knows it exists"""
+    if not msif_index.has_folder(folder):
+        started = time.perf_counter()
+        msif_index.ensure_folder(folder)
+        if stats is not None:
+            stats.add(MKDIR, time.perf_counter() - started)
+
+
+def write_set_nfo(msif_index, folder: str, data: bytes, overwrite: bool, recorded: bool = False,
+                  stats: ExportStats = None) -> str:
+    """Export one set.nfo.  An existing file is only rewritten when its
+    content differs; the sizes are compared first so a changed file is
+    usually detected without reading it.  When an existing file is not
+    going to be rewritten (overwrite declined, or the manifest already
+    records the content) the file is created exclusively, so writing a new
+    set.nfo and detecting an existing one each cost a single call.
+
+    Args:
+        msif_index (MsifIndex or VfsMsifIndex): the MSIF
+        folder (str): sanitized set folder name
+        data (bytes): the rendered set.nfo
+        overwrite (bool): update an existing set.nfo
+        recorded (bool, optional): the manifest says this content was already
+            exported to folder, so an existing set.nfo is not compared. Defaults to False.
+        stats (ExportStats, optional): records stat, mkdir, compare and write times. Defaults to None.
+
+    Raises:
+        OSError: the folder or file could not be created, read or written
+
+    Returns:
+        str: CREATED, UPDATED, UNCHANGED or KEPT
+    """
+    clock = time.perf_counter
+    if recorded or not overwrite:
+        _ensure_folder(msif_index, folder, stats)
+        started = clock()
+        if msif_index.create_nfo(folder, data):
+            if stats is not None:
+                stats.record_write(msif_index.nfo_location(folder), clock() - started)
+            return CREATED
+        if stats is not None:  # the failed create was the existence check
+            stats.add(STAT, clock() - started)
+        return UNCHANGED if recorded else KEPT
+    started = clock()
+    nfo_size = msif_index.nfo_size(folder)
+    if stats is not None and msif_index.has_folder(folder):  # no stat is made for a missing folder
+        stats.add(STAT, clock() - started)
+    _ensure_folder(msif_index, folder, stats)
+    outcome = CREATED if nfo_size is None else UPDATED
+    if outcome == UPDATED:
+        if nfo_size == len(data):
+            started = clock()
+            same = msif_index.read_nfo(folder) == data
+            if stats is not None:
+                stats.add(COMPARE, clock() - started)
+            if same:
+                return UNCHANGED
+    started = clock()
+    msif_index.write_nfo(folder, data)
+    if stats is not None:
+        stats.record_write(msif_index.nfo_location(folder), clock() - started)
+    return outcome
+
+
+class ParallelWriter:
+    """Runs write tasks on a thread pool so filesystem round trips overlap.
+    At most max_pending tasks are in flight; submit() blocks on the oldest
+    one beyond that.  Results are handed to on_done / on_error on the
+    submitting thread, in submission order, so callers need no locking.
+    An OSError fails only its own task.
+
+    Args:
+        workers (int): number of writer threads.  1 or less writes inline.
+        on_done (Callable): on_done(key, result) for each successful task
+        on_error (Callable): on_error(key, err) for each task that raised OSError
+        max_pending (int, optional): in-flight bound. Defaults to 8 per worker.
+    """
+
+    def __init__(self, workers: int, on_done: Callable, on_error: Callable, max_pending: int = None):
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix='export_set') if workers > 1 else None
+        self._max_pending = max(1, max_pending or workers * 8)
+        self._pending: deque[tuple[object, Future]] = deque()
+        self._on_done = on_done
+        self._on_error = on_error
+        self.workers = max(1, workers)
+        self.completed = 0
+        self.errors: list[tuple[object, OSError]] = []
+        self._started = time.perf_counter()
+        self.elapsed = 0.0
+
+    def __enter__(self) -> 'ParallelWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def submit(self, key, task: Callable, *args):
+        """Queue task(*args)
+
+        Args:
+            key: passed back to on_done / on_error
+            task (Callable): the write task
+        """
+        if self._executor is None:
+            try:
+                result = task(*args)
+            except OSError as err:
+                self._failed(key, err)
+            else:
+                self._done(key, result)
+            return
+        while len(self._pending) >= self._max_pending:
+            self._collect()
+        self._pending.append((key, self._executor.submit(task, *args)))
+
+    def close(self):
+        """Wait for every queued task and stop the threads"""
+        while self._pending:
+            self._collect()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        self.elapsed = time.perf_counter() - self._started
+
+    def summary(self) -> str:
+        """One line throughput summary, valid after close()"""
+        total = self.completed + len(self.errors)
+        rate = total / self.elapsed if self.elapsed > 0 else 0.0
+        return (f'{total} sets in {self.elapsed:.2f}s ({rate:.1f} sets/s) with {self.workers} '
+                f'writer threads, {len(self.errors)} failed')
+
+    def _collect(self):
+        key, future = self._pending.popleft()
+        try:
+            result = future.result()
+        except OSError as err:
+            self._failed(key, err)
+        else:
+            self._done(key, result)
+
+    def _done(self, key, result):
+        self.completed += 1
+        self._on_done(key, result)
+
+    def _failed(self, key, err: OSError):
+        self.errors.append((key, err))
+        self._on_error(key, err)
+
+
+def format_counts(counts: Counter) -> str:
+    """One line summary of write outcomes
+
+    Args:
+        counts (Counter): outcome -> number of files
+
+    Returns:
+        str: e.g. '3 created, 1 updated, 120 unchanged, 0 kept'
+    """
+    return ', '.join(f'{counts[outcome]} {outcome}' for outcome in (CREATED, UPDATED, UNCHANGED, KEPT))
@@ -0,0 +1,192 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+#    Copyright (C) 2025 Scott Smart
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+# pylint: disable=invalid-name
+""" Kodi service that keeps the MSIF up to date.  With the "After database
+update" method, video library notifications are collected and, once the
+library has been quiet for the configured delay, the export script is run
+silently for just the changed sets.  A finished library scan exports all
+sets, which the export manifest keeps cheap.  With the "Use timer" method
+all sets are exported every few hours.
+
+When set.nfo files list member movies, the set a movie leaves also needs
+exporting, so the service keeps the set of every movie: read once at
+start and kept up to date from the notifications.
+"""
+
+import json
+import time
+from typing import Optional
+
+import xbmc
+import xbmcaddon
+import xbmcgui
+from lib.jsonrpc import JsonRpcClient, JsonRpcError
+from lib.log import Logger
+
+ADDON = xbmcaddon.Addon()
+ADDON_ID = ADDON.getAddonInfo('id')
+LOG = Logger(ADDON_ID, log=xbmc.log)
+RUNNING_PROPERTY = f'{ADDON_ID}.running'  # set by default.py while an export runs
+
+METHOD_DISABLED = 0
+METHOD_LIBRARY_UPDATE = 1
+METHOD_TIMER = 2
+
+
+class ExportMonitor(xbmc.Monitor):
+    """Collects the sets touched by library notifications and exports them
+    after a quiet period
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.rpc = JsonRpcClient()
+        self.setids: set[int] = set()
+        self.movieids: set[int] = set()  # resolved to their set when exported
+        self.full_export = False
+        self.due = 0.0  # monotonic time of the pending export, 0 if none
+        self.next_timer = 0.0
+        self.movie_sets: Optional[dict[int, int]] = None  # movieid -> setid while tracked
+        self.load_settings()
+
+    def load_settings(self):
+        self.method = ADDON.getSettingInt('update_method')
+        self.delay = ADDON.getSettingInt('service_delay')
+        self.interval = ADDON.getSettingInt('timer_hours') * 3600
+        if self.method == METHOD_TIMER and not self.next_timer:
+            self.next_timer = time.monotonic() + self.interval
+        elif self.method != METHOD_TIMER:
+            self.next_timer = 0.0
+        # member movie lists go stale when a movie leaves its set
+        self.track_movies = self.method == METHOD_LIBRARY_UPDATE and ADDON.getSettingBool('nfo_movies')
+        if not self.track_movies:
+            self.movie_sets = None
+        elif self.movie_sets is None:
+            self.movie_sets = self.load_movie_sets()
+
+    def onSettingsChanged(self):
+        self.load_settings()
+
+    def onNotification(self, sender: str, method: str, data: str):
+        if self.method != METHOD_LIBRARY_UPDATE or sender != 'xbmc':
+            return
+        if method == 'VideoLibrary.OnScanFinished':
+            self.full_export = True
+        elif method == 'VideoLibrary.OnUpdate':
+            kind, itemid = notification_item(data)
+            if kind == 'set':
+                self.setids.add(itemid)
+            elif kind == 'movie':
+                self.movieids.add(itemid)
+            else:
+                return
+        elif method == 'VideoLibrary.OnRemove' and self.track_movies:
+            # a removed set leaves an orphan for reconcile, but a removed movie changes its set's list
+            kind, itemid = notification_item(data)
+            if kind != 'movie':
+                return
+            if self.movie_sets is None:
+                self.full_export = True
+            else:
+                self.setids.add(self.movie_sets.pop(itemid, 0))
+        else:
+            return
+        self.due = time.monotonic() + self.delay  # each notification restarts the delay
+
+    def tick(self):
+        """Run a due export"""
+        now = time.monotonic()
+        if self.next_timer and now >= self.next_timer:
+            self.full_export = True
+            self.due = now
+            self.next_timer = now + self.interval
+        if not self.due or now < self.due:
+            return
+        if xbmcgui.Window(10000).getProperty(RUNNING_PROPERTY) or xbmc.getCondVisibility('Library.IsScanningVideo'):
+            self.due = now + self.delay  # try again once the export or scan is done
+            return
+        self.due = 0.0
+        if self.track_movies and self.movie_sets is None:
+            # without the movies' previous sets every set may have lost a member
+            self.full_export = self.full_export or bool(self.movieids)
+            self.movie_sets = self.load_movie_sets()
+        if self.full_export:
+            LOG.info('service export of all sets')
+            xbmc.executebuiltin(f'RunScript({ADDON_ID},silent)')
+        else:
+            setids = self.setids | self.movie_setids()
+            setids.discard(0)
+            if setids:
+                LOG.info('service export of %d changed sets', len(setids))
+                arg = ';'.join(str(setid) for setid in sorted(setids))
+                xbmc.executebuiltin(f'RunScript({ADDON_ID},silent,setids={arg})')
+        self.setids.clear()
+        self.movieids.clear()
+        self.full_export = False
+
+    def movie_setids(self) -> set:
+        """Sets of the updated movies, in one batched round trip.  Tracked
+        movies also give the set they were in before.
+        """
+        movieids = sorted(self.movieids)
+        try:
+            results = self.rpc.batch([('VideoLibrary.GetMovieDetails', {'movieid': movieid, 'properties': ['setid']})
+                                      for movieid in movieids])
+        except JsonRpcError as err:
+            LOG.warning('could not look up the sets of updated movies: %s', err)
+            return set()
+        setids = set()
+        for movieid, result in zip(movieids, results):
+            if not isinstance(result, dict) or 'moviedetails' not in result:
+                continue
+            setid = result['moviedetails'].get('setid', 0)
+            setids.add(setid)
+            if self.movie_sets is not None:
+                setids.add(self.movie_sets.get(movieid, 0))
+                self.movie_sets[movieid] = setid
+        return setids
+
+    def load_movie_sets(self) -> Optional[dict]:
+        """movieid -> setid of every library movie
+
+        Returns:
+            Optional[dict]: the sets, None if the library could not be read
+        """
+        try:
+            result = self.rpc.call('VideoLibrary.GetMovies', {'properties': ['setid']})
+        except JsonRpcError as err:
+            LOG.warning('could not read the sets of the library movies: %s', err)
+            return None
+        return {movie['movieid']: movie.get('setid', 0) for movie in result.get('movies') or ()}
+
+
+def notification_item(data: str) -> tuple:
+    """(type, id) of the item in a VideoLibrary notification, (None, 0) if unreadable"""
+    try:
+        payload = json.loads(data)
+        item = payload.get('item', payload)
+        return item.get('type'), item.get('id', 0)
+    except (TypeError, ValueError, AttributeError):
+        return None, 0
+
+
+if __name__ == '__main__':
+    monitor = ExportMonitor()
+    while not monitor.waitForAbort(1):
+        monitor.tick()